@@ -26,6 +26,36 @@ from .helpers import (
 from .isf_converter import convert_isf_to_kodelife
 from .types import PassType, RenderPass, ShaderProfile
 
+# Read size for streaming .klproj files through the decompressor
+_READ_CHUNK_SIZE = 128 * 1024
+
+
+def _stream_decompress(path: str, chunk_size: int = _READ_CHUNK_SIZE) -> bytes:
+    """
+    Decompress a zlib-compressed file, feeding it to the decompressor in chunks.
+
+    Matches zlib.decompress(): data after the end of the stream is ignored,
+    and a truncated stream raises zlib.error.
+
+    Args:
+        path: Path to the compressed file
+        chunk_size: Number of compressed bytes to read at a time
+
+    Returns:
+        Decompressed data
+    """
+    decompressor = zlib.decompressobj()
+    parts = []
+    with open(path, "rb", buffering=0) as f:
+        while not decompressor.eof:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise zlib.error(
+                    "Error -5 while decompressing data: incomplete or truncated stream"
+                )
+            parts.append(decompressor.decompress(chunk))
+    return b"".join(parts)
+
 
 def extract_klproj(input_path: str, output_path: str) -> int:
     """
@@ -39,9 +69,7 @@ def extract_klproj(input_path: str, output_path: str) -> int:
         0 on success, 1 on error
     """
     try:
-        with open(input_path, "rb") as f:
-            compressed = f.read()
-            decompressed = zlib.decompress(compressed)
+        decompressed = _stream_decompress(input_path)
 
         with open(output_path, "wb") as f:
             f.write(decompressed)
@@ -64,10 +92,8 @@ def verify_klproj(filename: str) -> int:
         0 on success, 1 on error
     """
     try:
-        with open(filename, "rb") as f:
-            compressed = f.read()
-            xml_data = zlib.decompress(compressed)
-            print(xml_data.decode("utf-8"))
+        xml_data = _stream_decompress(filename)
+        print(xml_data.decode("utf-8"))
         return 0
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -267,8 +293,17 @@ def create_watch_project(
         return 1
 
 
-def main():
-    """Main CLI entry point."""
+def main(argv: list = None) -> int:
+    """
+    Main CLI entry point.
+
+    Args:
+        argv: Command-line arguments, excluding the program name
+              (default: sys.argv[1:])
+
+    Returns:
+        Exit code from the selected command
+    """
     parser = argparse.ArgumentParser(
         description="KodeLife .klproj file utilities",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -347,7 +382,7 @@ def main():
         help="Graphics API (default: GL3)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command == "extract":
         return extract_klproj(args.input, args.output)
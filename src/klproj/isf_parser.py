@@ -12,8 +12,14 @@ ISF Specification References:
 
 import json
 import re
+import sys
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
+
+# Structural tokens for the ISF header scanner: braces, string openers and the
+# comment terminator outside strings, and quote/escape characters inside strings
+_JSON_STRUCTURAL_RE = re.compile(r'[{}"]|\*/')
+_JSON_STRING_RE = re.compile(r'["\\]')
 
 
 @dataclass
@@ -37,6 +43,13 @@ class ISFInput:
     values: Optional[List[int]] = None  # For 'long' type
     labels: Optional[List[str]] = None  # For 'long' type
 
+    def __post_init__(self):
+        # Input names and types repeat across shader collections; intern them
+        if isinstance(self.name, str):
+            self.name = sys.intern(self.name)
+        if isinstance(self.input_type, str):
+            self.input_type = sys.intern(self.input_type)
+
 
 @dataclass
 class ISFPass:
@@ -56,6 +69,10 @@ class ISFPass:
     name: Optional[str] = None
     main: Optional[str] = None  # Custom entry point function name
 
+    def __post_init__(self):
+        if isinstance(self.target, str):
+            self.target = sys.intern(self.target)
+
 
 @dataclass
 class ISFImported:
@@ -116,6 +133,100 @@ def parse_isf_file(file_path: str) -> ISFShader:
     return parse_isf_string(content)
 
 
+def _find_json_block(content: str, start: int) -> Optional[int]:
+    """
+    Find the end of the JSON object that opens at ``content[start]``.
+
+    Walks structural characters only, tracking brace depth and skipping over
+    string literals (honouring backslash escapes), so braces or comment
+    markers inside JSON strings do not confuse the scan.
+
+    Args:
+        content: ISF file content
+        start: Offset of the opening "{"
+
+    Returns:
+        Offset just past the matching "}", or None if the object is unbalanced
+        or a "*/" outside a string closes the comment first
+    """
+    depth = 0
+    pos = start
+    while True:
+        match = _JSON_STRUCTURAL_RE.search(content, pos)
+        if match is None:
+            return None
+        token = match.group()
+        pos = match.end()
+
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                return pos
+        elif token == '"':
+            while True:
+                match = _JSON_STRING_RE.search(content, pos)
+                if match is None:
+                    return None
+                pos = match.end()
+                if match.group() == '"':
+                    break
+                pos += 1  # Skip the escaped character
+        else:
+            return None
+
+
+def find_isf_header_bounds(content: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Locate the JSON metadata block in the leading ISF comment.
+
+    The content must start with "/*", optionally followed by whitespace and a
+    "{". The JSON object is delimited by brace matching (see _find_json_block)
+    and the header ends at the next "*/". If the braces do not balance, the
+    block falls back to ending at the first "*/" whose preceding
+    non-whitespace character is "}", so malformed JSON is still handed to the
+    JSON decoder and reported as such.
+
+    Args:
+        content: ISF file content
+
+    Returns:
+        Tuple of (json_start, json_end, header_end) offsets, or None if the
+        content does not start with a JSON comment block
+    """
+    if not content.startswith("/*"):
+        return None
+
+    json_start = 2
+    length = len(content)
+    while json_start < length and content[json_start].isspace():
+        json_start += 1
+    if not content.startswith("{", json_start):
+        return None
+
+    json_end = _find_json_block(content, json_start)
+    if json_end is not None:
+        close = content.find("*/", json_end)
+        if close != -1:
+            return json_start, json_end, close + 2
+
+    search_from = json_start + 1
+    while True:
+        close = content.find("*/", search_from)
+        if close == -1:
+            return None
+
+        # The JSON block ends at the last non-whitespace character before "*/"
+        json_end = close
+        while json_end > json_start and content[json_end - 1].isspace():
+            json_end -= 1
+        if json_end - 1 > json_start and content[json_end - 1] == "}":
+            return json_start, json_end, close + 2
+
+        search_from = close + 1
+
+
 def parse_isf_string(content: str) -> ISFShader:
     """
     Parse ISF content from a string.
@@ -130,11 +241,12 @@ def parse_isf_string(content: str) -> ISFShader:
         ValueError: If the content is not valid ISF
     """
     # Extract JSON metadata from comment block
-    json_match = re.match(r"/\*\s*(\{.*?\})\s*\*/", content, re.DOTALL)
-    if not json_match:
+    bounds = find_isf_header_bounds(content)
+    if bounds is None:
         raise ValueError("No JSON metadata found in ISF file (must start with /* { ... } */)")
 
-    json_str = json_match.group(1)
+    json_start, json_end, header_end = bounds
+    json_str = content[json_start:json_end]
 
     try:
         metadata = json.loads(json_str)
@@ -142,7 +254,7 @@ def parse_isf_string(content: str) -> ISFShader:
         raise ValueError(f"Invalid JSON metadata in ISF file: {e}") from e
 
     # Extract shader code (everything after the JSON comment)
-    shader_code = content[json_match.end() :].strip()
+    shader_code = content[header_end:].strip()
 
     # Parse metadata
     shader = ISFShader()
@@ -153,9 +265,9 @@ def parse_isf_string(content: str) -> ISFShader:
     shader.credit = metadata.get("CREDIT")
     shader.categories = metadata.get("CATEGORIES", [])
 
-    # Parse inputs
-    for input_dict in metadata.get("INPUTS", []):
-        isf_input = ISFInput(
+    # Parse inputs ("NAME" and "TYPE" are required)
+    shader.inputs = [
+        ISFInput(
             name=input_dict["NAME"],
             input_type=input_dict["TYPE"],
             label=input_dict.get("LABEL"),
@@ -166,11 +278,12 @@ def parse_isf_string(content: str) -> ISFShader:
             values=input_dict.get("VALUES"),
             labels=input_dict.get("LABELS"),
         )
-        shader.inputs.append(isf_input)
+        for input_dict in metadata.get("INPUTS", ())
+    ]
 
     # Parse passes
-    for pass_dict in metadata.get("PASSES", []):
-        isf_pass = ISFPass(
+    shader.passes = [
+        ISFPass(
             target=pass_dict.get("TARGET"),  # Can be None for final output
             persistent=bool(pass_dict.get("PERSISTENT", False)),
             float_precision=bool(pass_dict.get("FLOAT", False)),
@@ -180,18 +293,24 @@ def parse_isf_string(content: str) -> ISFShader:
             name=pass_dict.get("NAME"),
             main=pass_dict.get("MAIN"),
         )
-        shader.passes.append(isf_pass)
+        for pass_dict in metadata.get("PASSES", ())
+    ]
 
     # Parse imported images
-    imported_data = metadata.get("IMPORTED", {})
+    imported_data = metadata.get("IMPORTED")
     # IMPORTED can be either a dict or a list (usually empty list)
     if isinstance(imported_data, dict):
-        for name, import_info in imported_data.items():
-            if isinstance(import_info, dict):
-                path = import_info.get("PATH", "")
-            else:
-                path = str(import_info)
-            shader.imported.append(ISFImported(name=name, path=path))
+        shader.imported = [
+            ISFImported(
+                name=name,
+                path=(
+                    import_info.get("PATH", "")
+                    if isinstance(import_info, dict)
+                    else str(import_info)
+                ),
+            )
+            for name, import_info in imported_data.items()
+        ]
     # If it's a list, it's usually empty or has different structure - skip for now
 
     return shader
@@ -5,39 +5,37 @@ This module provides utilities for creating Metal Shading Language (MSL) shader
 code for KodeLife projects. Based on analysis of KodeLife's Metal shader templates.
 """
 
+import functools
 from typing import List, Tuple
 
 from .types import Parameter, ParamType, ShaderProfile, ShaderSource
 
-
-def generate_metal_vertex_shader(
-    parameters: List[Parameter], include_shadertoy_compat: bool = False
-) -> str:
-    """
-    Generate a Metal vertex shader with uniform buffer.
-
-    Args:
-        parameters: List of parameters to include in uniform buffer
-        include_shadertoy_compat: Whether to include Shadertoy-style parameter names
-
-    Returns:
-        Complete Metal vertex shader source code
-
-    Example:
-        >>> params = create_shadertoy_params()
-        >>> mvp_param = create_mvp_param()
-        >>> vertex_code = generate_metal_vertex_shader(params + [mvp_param], True)
-    """
-    # Build uniform struct members
-    uniform_members = []
-    for param in parameters:
-        metal_type = _param_type_to_metal_type(param.param_type)
-        if metal_type:
-            uniform_members.append(f"    {metal_type} {param.variable_name};")
-
-    uniform_struct = "\n".join(uniform_members) if uniform_members else "    // No uniforms"
-
-    shader_code = f"""#include <metal_stdlib>
+# KodeLife parameter types mapped to their Metal uniform types
+_METAL_TYPE_MAP = {
+    ParamType.CLOCK: "float",
+    ParamType.FRAME_DELTA: "float",
+    ParamType.FRAME_NUMBER: "int",
+    ParamType.FRAME_RESOLUTION: "float2",
+    ParamType.INPUT_MOUSE_SIMPLE: "float4",
+    ParamType.DATE: "float4",
+    ParamType.AUDIO_SAMPLE_RATE: "float",
+    ParamType.AUDIO_SPECTRUM_SPLIT: "float3",
+    ParamType.AUDIO_SPECTRUM_FULL: "float",
+    ParamType.TRANSFORM_MVP: "float4x4",
+    ParamType.CONSTANT_FLOAT1: "float",
+    ParamType.CONSTANT_FLOAT2: "float2",
+    ParamType.CONSTANT_FLOAT3: "float3",
+    ParamType.CONSTANT_FLOAT4: "float4",
+    # Note: CONSTANT_TEXTURE_2D is handled separately in fragment shader bindings
+}
+
+# Parameter set reduced to the fields that affect generated code, with
+# parameters that have no Metal uniform type already dropped:
+# ((metal_type, variable_name), ...)
+ParamSignature = Tuple[Tuple[str, str], ...]
+
+# Shader skeletons shared by every call; only the placeholders vary
+_VERTEX_SHADER_TEMPLATE = """#include <metal_stdlib>
 using namespace metal;
 
 struct VS_INPUT
@@ -71,7 +69,90 @@ VS_OUTPUT vs_main(
     return out;
 }}
 """
-    return shader_code
+
+_COMPUTE_SHADER_TEMPLATE = """#include <metal_stdlib>
+#include <simd/simd.h>
+
+using namespace metal;
+
+struct CS_UNIFORM
+{{
+{uniform_struct}
+}};
+
+kernel void cs_main(
+    constant CS_UNIFORM& uniform [[buffer(16)]],
+    uint3 globalInvocationID [[thread_position_in_grid]]{texture_param_str})
+{{
+    // Compute shader body
+    // TODO: Implement compute logic
+}}
+"""
+
+
+def _param_signature(parameters: List[Parameter]) -> ParamSignature:
+    """
+    Reduce parameters to a hashable signature for the codegen caches.
+
+    Parameters are filtered once here: those without a Metal uniform type
+    (e.g. textures) are dropped and the rest are paired with their Metal type,
+    so the generators never repeat the lookup. Only the Metal type and
+    variable name influence generated code, so parameter lists that agree on
+    those share one cached shader string.
+
+    Args:
+        parameters: List of parameters
+
+    Returns:
+        Tuple of (metal_type, variable_name) pairs
+    """
+    type_map = _METAL_TYPE_MAP
+    return tuple(
+        (type_map[param.param_type], param.variable_name)
+        for param in parameters
+        if param.param_type in type_map
+    )
+
+
+def _build_uniform_struct(signature: ParamSignature) -> str:
+    """
+    Build the member lines of a Metal uniform struct.
+
+    Args:
+        signature: Parameter signature from _param_signature()
+
+    Returns:
+        Uniform struct body, or a placeholder comment if no parameter maps to a Metal type
+    """
+    lines = [f"    {metal_type} {name};" for metal_type, name in signature]
+    return "\n".join(lines) if lines else "    // No uniforms"
+
+
+def generate_metal_vertex_shader(
+    parameters: List[Parameter], include_shadertoy_compat: bool = False
+) -> str:
+    """
+    Generate a Metal vertex shader with uniform buffer.
+
+    Args:
+        parameters: List of parameters to include in uniform buffer
+        include_shadertoy_compat: Whether to include Shadertoy-style parameter names
+
+    Returns:
+        Complete Metal vertex shader source code
+
+    Example:
+        >>> params = create_shadertoy_params()
+        >>> mvp_param = create_mvp_param()
+        >>> vertex_code = generate_metal_vertex_shader(params + [mvp_param], True)
+    """
+    return _generate_metal_vertex_shader(_param_signature(parameters))
+
+
+@functools.lru_cache(maxsize=256)
+def _generate_metal_vertex_shader(signature: ParamSignature) -> str:
+    """Generate (and cache) the vertex shader for a parameter signature."""
+    return _VERTEX_SHADER_TEMPLATE.format(uniform_struct=_build_uniform_struct(signature))
 
 
 def generate_metal_fragment_shader_shadertoy(
@@ -99,60 +180,55 @@ def generate_metal_fragment_shader_shadertoy(
         >>> body = "float2 uv = fragCoord.xy / iResolution.xy; fragColor = float4(uv, 0.0, 1.0);"
         >>> frag_code = generate_metal_fragment_shader_shadertoy(params, textures, body)
     """
-    if texture_params is None:
-        texture_params = []
+    texture_names = tuple(param.variable_name for param in texture_params or ())
+    return _generate_metal_fragment_shader_shadertoy(
+        _param_signature(parameters), texture_names, shader_body
+    )
+
 
-    # Build uniform struct members
+@functools.lru_cache(maxsize=256)
+def _generate_metal_fragment_shader_shadertoy(
+    signature: ParamSignature, texture_names: Tuple[str, ...], shader_body: str
+) -> str:
+    """Generate (and cache) the fragment shader for a parameter signature."""
+    # Build uniform struct members, mainImage signature and call arguments
+    # in a single pass over the parameters
     uniform_members = []
-    for param in parameters:
-        metal_type = _param_type_to_metal_type(param.param_type)
-        if metal_type:
-            uniform_members.append(f"    {metal_type} {param.variable_name};")
+    signature_params = []
+    uniform_args = []
+    for metal_type, name in signature:
+        uniform_members.append(f"    {metal_type} {name};")
+        signature_params.append(f"{metal_type} {name}")
+        uniform_args.append(f"u.{name}")
 
     uniform_struct = "\n".join(uniform_members) if uniform_members else "    // No uniforms"
 
-    # Build texture parameters for function signature
+    # Build texture parameters for function signature, call and fs_main bindings
     texture_fn_params = []
     texture_fn_args = []
     texture_bindings = []
-    for i, param in enumerate(texture_params):
-        texture_fn_params.append(f"texture2d<float> {param.variable_name}")
-        texture_fn_args.append(param.variable_name)
-        texture_bindings.append(f"    texture2d<float> {param.variable_name} [[texture({i})]]")
+    for i, name in enumerate(texture_names):
+        texture_fn_params.append(f"texture2d<float> {name}")
+        texture_fn_args.append(name)
+        texture_bindings.append(f"    texture2d<float> {name} [[texture({i})]]")
+
+    # Extra mainImage parameters (uniforms, then textures), shared by the
+    # forward declaration and the definition
+    mainimage_extra_params = []
+    if signature_params:
+        mainimage_extra_params += [",\n               ", ", ".join(signature_params)]
+    if texture_fn_params:
+        mainimage_extra_params += [",\n               ", ", ".join(texture_fn_params)]
+    mainimage_params = "".join(mainimage_extra_params)
+
+    uniform_args_str = "".join([", ", ", ".join(uniform_args)]) if uniform_args else ""
 
-    # Build mainImage function signature
     if texture_fn_params:
-        mainimage_params = ",\n               " + ", ".join(texture_fn_params)
-        mainimage_args = ",\n              " + ", ".join(texture_fn_args)
+        mainimage_args = "".join([",\n              ", ", ".join(texture_fn_args)])
+        texture_binding_str = "".join([",\n    ", ",\n    ".join(texture_bindings)])
     else:
-        mainimage_params = ""
         mainimage_args = ""
-
-    # Build texture bindings for fs_main
-    texture_binding_str = ",\n    ".join(texture_bindings) if texture_bindings else ""
-    if texture_binding_str:
-        texture_binding_str = ",\n    " + texture_binding_str
-
-    # Build parameter list for mainImage signature - just the types
-    mainimage_signature_params = []
-    for param in parameters:
-        metal_type = _param_type_to_metal_type(param.param_type)
-        if metal_type:
-            mainimage_signature_params.append(f"{metal_type} {param.variable_name}")
-
-    mainimage_signature_str = (
-        ", ".join(mainimage_signature_params) if mainimage_signature_params else ""
-    )
-    if mainimage_signature_str:
-        mainimage_signature_str = ",\n               " + mainimage_signature_str
-
-    # Build parameter list for mainImage call (extract from uniform struct)
-    uniform_param_names = [
-        p.variable_name for p in parameters if _param_type_to_metal_type(p.param_type)
-    ]
-    uniform_args = ", ".join([f"u.{name}" for name in uniform_param_names])
-    if uniform_args:
-        uniform_args = ", " + uniform_args
+        texture_binding_str = ""
 
     # Default shader body if none provided
     if shader_body is None:
@@ -173,7 +249,7 @@ struct FS_UNIFORM
 {uniform_struct}
 }};
 
-void mainImage(thread float4&, float2{mainimage_signature_str}{mainimage_params});
+void mainImage(thread float4&, float2{mainimage_params});
 
 fragment
 float4 fs_main(
@@ -181,14 +257,14 @@ float4 fs_main(
     constant FS_UNIFORM& u[[buffer(16)]]{texture_binding_str})
 {{
     float4 col;
-    mainImage(col, In.v_texcoord * u.iResolution{uniform_args}{mainimage_args});
+    mainImage(col, In.v_texcoord * u.iResolution{uniform_args_str}{mainimage_args});
     return col;
 }}
 
 ////////////////////////////////////////////////////////////////////////////////
 ////////////////////////////////////////////////////////////////////////////////
 
-void mainImage(thread float4& fragColor, float2 fragCoord{mainimage_signature_str}{mainimage_params})
+void mainImage(thread float4& fragColor, float2 fragCoord{mainimage_params})
 {{
     {shader_body}
 }}
@@ -217,17 +293,18 @@ def generate_metal_compute_shader(
         >>> outputs = [("outputTexture", 0)]
         >>> compute_code = generate_metal_compute_shader(params, outputs)
     """
-    if output_textures is None:
-        output_textures = []
+    return _generate_metal_compute_shader(
+        _param_signature(parameters),
+        tuple((tex_name, binding) for tex_name, binding in output_textures or ()),
+    )
 
-    # Build uniform struct members
-    uniform_members = []
-    for param in parameters:
-        metal_type = _param_type_to_metal_type(param.param_type)
-        if metal_type:
-            uniform_members.append(f"    {metal_type} {param.variable_name};")
 
-    uniform_struct = "\n".join(uniform_members) if uniform_members else "    // No uniforms"
+@functools.lru_cache(maxsize=256)
+def _generate_metal_compute_shader(
+    signature: ParamSignature, output_textures: Tuple[Tuple[str, int], ...]
+) -> str:
+    """Generate (and cache) the compute shader for a parameter signature."""
+    uniform_struct = _build_uniform_struct(signature)
 
     # Build texture parameters
     texture_params = []
@@ -240,55 +317,9 @@ def generate_metal_compute_shader(
     if texture_param_str:
         texture_param_str = ",\n" + texture_param_str
 
-    shader_code = f"""#include <metal_stdlib>
-#include <simd/simd.h>
-
-using namespace metal;
-
-struct CS_UNIFORM
-{{
-{uniform_struct}
-}};
-
-kernel void cs_main(
-    constant CS_UNIFORM& uniform [[buffer(16)]],
-    uint3 globalInvocationID [[thread_position_in_grid]]{texture_param_str})
-{{
-    // Compute shader body
-    // TODO: Implement compute logic
-}}
-"""
-    return shader_code
-
-
-def _param_type_to_metal_type(param_type: ParamType) -> str:
-    """
-    Map KodeLife parameter types to Metal types.
-
-    Args:
-        param_type: KodeLife parameter type
-
-    Returns:
-        Metal type string, or empty string if not applicable
-    """
-    type_map = {
-        ParamType.CLOCK: "float",
-        ParamType.FRAME_DELTA: "float",
-        ParamType.FRAME_NUMBER: "int",
-        ParamType.FRAME_RESOLUTION: "float2",
-        ParamType.INPUT_MOUSE_SIMPLE: "float4",
-        ParamType.DATE: "float4",
-        ParamType.AUDIO_SAMPLE_RATE: "float",
-        ParamType.AUDIO_SPECTRUM_SPLIT: "float3",
-        ParamType.AUDIO_SPECTRUM_FULL: "float",
-        ParamType.TRANSFORM_MVP: "float4x4",
-        ParamType.CONSTANT_FLOAT1: "float",
-        ParamType.CONSTANT_FLOAT2: "float2",
-        ParamType.CONSTANT_FLOAT3: "float3",
-        ParamType.CONSTANT_FLOAT4: "float4",
-        # Note: CONSTANT_TEXTURE_2D is handled separately in fragment shader bindings
-    }
-    return type_map.get(param_type, "")
+    return _COMPUTE_SHADER_TEMPLATE.format(
+        uniform_struct=uniform_struct, texture_param_str=texture_param_str
+    )
 
 
 def create_metal_vertex_source(parameters: List[Parameter]) -> ShaderSource:
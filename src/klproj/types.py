@@ -5,6 +5,7 @@ This module contains all data classes, enums, and type definitions used
 to construct KodeLife .klproj files.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List
@@ -256,6 +257,14 @@ class Parameter:
     ui_expanded: int = 0
     properties: Dict = field(default_factory=dict)
 
+    def __post_init__(self):
+        # The same handful of names (iTime, iResolution, ...) recur across
+        # projects; intern them so equal names share one string object
+        if isinstance(self.display_name, str):
+            self.display_name = sys.intern(self.display_name)
+        if isinstance(self.variable_name, str):
+            self.variable_name = sys.intern(self.variable_name)
+
 
 @dataclass
 class ShaderSource:
@@ -3,17 +3,37 @@ Utility modules for klproj tools.
 
 This package provides shared functionality for ISF discovery, batch processing,
 analysis, and reporting.
+
+Submodules are imported lazily on first attribute access, so importing one
+utility (e.g. ``klproj.utils.isf_discovery``) does not load the others.
 """
 
-from .analysis import (
-    AnalysisIssue,
-    BatchAnalysisResult,
-    FileAnalysisResult,
-    KlprojAnalyzer,
-)
-from .batch_processor import BatchConverter, ConversionResult
-from .isf_discovery import ISFDiscovery, ISFInfo
-from .reporter import ConversionReporter
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .analysis import (
+        AnalysisIssue,
+        BatchAnalysisResult,
+        FileAnalysisResult,
+        KlprojAnalyzer,
+    )
+    from .batch_processor import BatchConverter, ConversionResult
+    from .isf_discovery import ISFDiscovery, ISFInfo
+    from .reporter import ConversionReporter
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "ISFDiscovery": ".isf_discovery",
+    "ISFInfo": ".isf_discovery",
+    "BatchConverter": ".batch_processor",
+    "ConversionResult": ".batch_processor",
+    "ConversionReporter": ".reporter",
+    "KlprojAnalyzer": ".analysis",
+    "FileAnalysisResult": ".analysis",
+    "BatchAnalysisResult": ".analysis",
+    "AnalysisIssue": ".analysis",
+}
 
 __all__ = [
     "ISFDiscovery",
@@ -26,3 +46,19 @@ __all__ = [
     "BatchAnalysisResult",
     "AnalysisIssue",
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining ``name`` on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
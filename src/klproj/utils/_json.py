@@ -0,0 +1,39 @@
+"""
+JSON output shared by the klproj utilities.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+# Prefer orjson for writing results when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _write_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Write data to a file as indented JSON.
+
+    The document is serialized up front so the file is written with a single
+    write() call. orjson is used when installed, falling back to the json
+    module for data orjson rejects (e.g. integers wider than 64 bits).
+
+    Args:
+        path: Path to output JSON file
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            with open(path, "wb") as f:
+                f.write(encoded)
+            return
+
+    with open(path, "w") as f:
+        f.write(json.dumps(data, indent=2))
@@ -5,16 +5,144 @@ This module provides functionality to extract, parse, and analyze .klproj files
 for structural issues, missing uniforms, undefined variables, and other problems.
 """
 
-import json
+import functools
+import io
+import itertools
+import os
 import re
-import subprocess
-import xml.etree.ElementTree as ET
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set
-
-
-@dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+from ._json import _write_json
+
+# Prefer lxml (libxml2) for parsing when it is installed; the stdlib
+# ElementTree API used below is compatible with both.
+try:
+    from lxml import etree as ET
+
+    _Element = ET._Element
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    _Element = ET.Element
+
+# Path from a <pass> element to its first fragment shader stage
+_FRAGMENT_STAGE_PATH = "stages/stage[@type='FRAGMENT']"
+
+# Documents larger than this are parsed incrementally, discarding subtrees
+# that no check reads (see _parse_pruned())
+_STREAM_PARSE_THRESHOLD = 1 << 20
+
+# Shader source patterns. Declarations capture (type, name) after an optional
+# precision qualifier.
+_COMMENT_RE = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+_UNIFORM_DECL_RE = re.compile(r"\buniform\s+(?:(?:highp|mediump|lowp)\s+)?(\w+)\s+(\w+)")
+_CONST_DECL_RE = re.compile(r"\bconst\s+(?:(?:highp|mediump|lowp)\s+)?(\w+)\s+(\w+)")
+
+# Maps every ASCII character that cannot appear in an identifier to a space,
+# so translate() + split() breaks shader source into identifier-like words
+_IDENTIFIER_SPLIT_TABLE = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")}
+)
+
+
+# GLSL keywords and built-ins filtered out of potential variable uses
+_GLSL_KEYWORDS: FrozenSet[str] = frozenset(
+    {
+        "void",
+        "main",
+        "if",
+        "else",
+        "for",
+        "while",
+        "do",
+        "return",
+        "break",
+        "continue",
+        "in",
+        "out",
+        "inout",
+        "uniform",
+        "const",
+        "attribute",
+        "varying",
+        "float",
+        "vec2",
+        "vec3",
+        "vec4",
+        "mat2",
+        "mat3",
+        "mat4",
+        "int",
+        "bool",
+        "sampler2D",
+        "samplerCube",
+        "true",
+        "false",
+        "gl_Position",
+        "gl_FragCoord",
+        "gl_FragColor",
+        "fragColor",
+        "texture",
+        "mix",
+        "clamp",
+        "abs",
+        "fract",
+        "sin",
+        "cos",
+        "dot",
+        "length",
+        "normalize",
+        "floor",
+        "ceil",
+        "mod",
+        "min",
+        "max",
+        "step",
+        "smoothstep",
+        "sqrt",
+        "pow",
+        "exp",
+        "log",
+        "radians",
+        "degrees",
+        "r",
+        "g",
+        "b",
+        "a",
+        "x",
+        "y",
+        "z",
+        "w",
+        "s",
+        "t",
+        "p",
+        "q",
+        "rg",
+        "gb",
+        "ba",
+        "rb",
+        "xy",
+        "yz",
+        "zw",
+        "xw",
+        "rgb",
+        "rgba",
+        "xyz",
+        "xyzw",
+        "returnMe",
+        "co",
+        "c",
+        "K",
+        "pt",  # Common local variable names
+    }
+)
+
+
+@dataclass(slots=True)
 class AnalysisIssue:
     """Represents a single analysis issue."""
 
@@ -24,8 +152,18 @@ class AnalysisIssue:
     pass_index: Optional[int] = None
     details: Dict = field(default_factory=dict)
 
+    def to_dict(self) -> Dict:
+        """Serialize the issue for the JSON results file."""
+        return {
+            "severity": self.severity,
+            "category": self.category,
+            "message": self.message,
+            "pass": self.pass_index,
+            "details": self.details,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class FileAnalysisResult:
     """Results from analyzing a single .klproj file."""
 
@@ -50,7 +188,7 @@ class FileAnalysisResult:
         return sum(1 for issue in self.issues if issue.severity == "warning")
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchAnalysisResult:
     """Results from analyzing multiple .klproj files."""
 
@@ -83,49 +221,97 @@ class BatchAnalysisResult:
 
     def save_json(self, output_path: str):
         """Save analysis results to JSON file."""
+        # Build the per-file entries and the summary counts in one pass
+        files = {}
+        files_with_errors = files_with_warnings = total_errors = total_warnings = 0
+        for name, result in self.file_results.items():
+            errors = []
+            warnings = []
+            for issue in result.issues:
+                if issue.severity == "error":
+                    errors.append(issue.to_dict())
+                elif issue.severity == "warning":
+                    warnings.append(issue.to_dict())
+            files[name] = {"errors": errors, "warnings": warnings, "info": result.info}
+
+            files_with_errors += bool(errors)
+            files_with_warnings += bool(warnings)
+            total_errors += len(errors)
+            total_warnings += len(warnings)
+
         data = {
             "summary": {
                 "total_files": self.total_files,
-                "files_with_errors": self.files_with_errors,
-                "files_with_warnings": self.files_with_warnings,
-                "total_errors": self.total_errors,
-                "total_warnings": self.total_warnings,
-            },
-            "files": {
-                name: {
-                    "errors": [
-                        {
-                            "severity": issue.severity,
-                            "category": issue.category,
-                            "message": issue.message,
-                            "pass": issue.pass_index,
-                            "details": issue.details,
-                        }
-                        for issue in result.issues
-                        if issue.severity == "error"
-                    ],
-                    "warnings": [
-                        {
-                            "severity": issue.severity,
-                            "category": issue.category,
-                            "message": issue.message,
-                            "pass": issue.pass_index,
-                            "details": issue.details,
-                        }
-                        for issue in result.issues
-                        if issue.severity == "warning"
-                    ],
-                    "info": result.info,
-                }
-                for name, result in self.file_results.items()
+                "files_with_errors": files_with_errors,
+                "files_with_warnings": files_with_warnings,
+                "total_errors": total_errors,
+                "total_warnings": total_warnings,
             },
+            "files": files,
         }
 
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        if not output_file.parent.is_dir():
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        _write_json(output_file, data)
+
+
+# Shaders often repeat across the projects in a batch (e.g. several files
+# converted from one ISF source), so per-shader scans are cached by source
+# text. Each analysis worker process keeps its own cache.
+
+
+@functools.lru_cache(maxsize=4096)
+def _declared_uniforms(shader_code: str) -> FrozenSet[str]:
+    """Names of all uniforms declared in shader code."""
+    return frozenset(match[1] for match in _UNIFORM_DECL_RE.findall(shader_code))
+
+
+@functools.lru_cache(maxsize=4096)
+def _shader_variables(
+    shader_code: str,
+) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+    """
+    Scan shader code for declared and potentially used variables.
+
+    Args:
+        shader_code: Shader source
+
+    Returns:
+        Tuple of (uniforms, consts, potential_uses) name sets; potential_uses
+        still includes GLSL keywords and built-ins
+    """
+    # Declarations are matched in the raw source, so a commented-out
+    # declaration still counts as declared
+    uniforms = {name for _, name in _UNIFORM_DECL_RE.findall(shader_code)}
+    consts = {name for _, name in _CONST_DECL_RE.findall(shader_code)}
+
+    # Replace comments with a space so tokens on either side stay separate
+    code_clean = _COMMENT_RE.sub(" ", shader_code)
+
+    # Split into words in C and keep the ASCII identifiers (numeric literals
+    # such as 1.0e5 split into words starting with a digit and are dropped)
+    identifiers = {
+        word
+        for word in set(code_clean.translate(_IDENTIFIER_SPLIT_TABLE).split())
+        if word.isascii() and word.isidentifier()
+    }
+
+    # GLSL keywords are left in: callers filter them with their own keyword set
+    var_uses = identifiers - consts
+
+    return frozenset(uniforms), frozenset(consts), frozenset(var_uses)
 
-        with open(output_file, "w") as f:
-            json.dump(data, f, indent=2)
+
+# Extracted XML as accepted by the check_* methods: a path to an XML file, the
+# XML bytes returned by extract_to_xml(), or an already-parsed root element
+XMLSource = Union[Path, bytes, _Element]
+
+
+def _result_path(xml: XMLSource) -> Path:
+    """Path to record on a check result for the given XML source."""
+    return Path(xml) if isinstance(xml, (str, Path)) else Path("<memory>")
 
 
 class KlprojAnalyzer:
@@ -147,134 +333,82 @@ class KlprojAnalyzer:
         self.isf_source_dir = Path(isf_source_dir) if isf_source_dir else None
         self.verbose = verbose
 
-        # GLSL keywords and built-ins to filter out
-        self.glsl_keywords = {
-            "void",
-            "main",
-            "if",
-            "else",
-            "for",
-            "while",
-            "do",
-            "return",
-            "break",
-            "continue",
-            "in",
-            "out",
-            "inout",
-            "uniform",
-            "const",
-            "attribute",
-            "varying",
-            "float",
-            "vec2",
-            "vec3",
-            "vec4",
-            "mat2",
-            "mat3",
-            "mat4",
-            "int",
-            "bool",
-            "sampler2D",
-            "samplerCube",
-            "true",
-            "false",
-            "gl_Position",
-            "gl_FragCoord",
-            "gl_FragColor",
-            "fragColor",
-            "texture",
-            "mix",
-            "clamp",
-            "abs",
-            "fract",
-            "sin",
-            "cos",
-            "dot",
-            "length",
-            "normalize",
-            "floor",
-            "ceil",
-            "mod",
-            "min",
-            "max",
-            "step",
-            "smoothstep",
-            "sqrt",
-            "pow",
-            "exp",
-            "log",
-            "radians",
-            "degrees",
-            "r",
-            "g",
-            "b",
-            "a",
-            "x",
-            "y",
-            "z",
-            "w",
-            "s",
-            "t",
-            "p",
-            "q",
-            "rg",
-            "gb",
-            "ba",
-            "rb",
-            "xy",
-            "yz",
-            "zw",
-            "xw",
-            "rgb",
-            "rgba",
-            "xyz",
-            "xyzw",
-            "returnMe",
-            "co",
-            "c",
-            "K",
-            "pt",  # Common local variable names
-        }
+        # GLSL keywords and built-ins filtered out of variable uses
+        self.glsl_keywords = set(_GLSL_KEYWORDS)
 
-    def extract_to_xml(self, klproj_path: Path) -> Optional[Path]:
+    def extract_to_xml(self, klproj_path: Path) -> Optional[bytes]:
         """
-        Extract .klproj file to XML using CLI.
+        Extract .klproj file to XML in-process.
 
         Args:
             klproj_path: Path to .klproj file
 
         Returns:
-            Path to extracted XML file, or None on error
+            Decompressed XML document, or None on error
         """
-        xml_path = klproj_path.with_suffix(".xml")
+        try:
+            with open(klproj_path, "rb") as f:
+                return zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            return None
 
-        result = subprocess.run(
-            ["uv", "run", "klproj", "extract", str(klproj_path), str(xml_path)],
-            capture_output=True,
-            text=True,
-        )
+    def _parse_root(self, xml: XMLSource) -> _Element:
+        """
+        Parse extracted XML from a file path or an in-memory document.
 
-        if result.returncode == 0 and xml_path.exists():
-            return xml_path
+        Args:
+            xml: Path to an XML file, XML bytes from extract_to_xml(), or an
+                already-parsed root element (returned unchanged)
+
+        Returns:
+            Root element of the document
+        """
+        if ET.iselement(xml):
+            return xml
+        if isinstance(xml, bytes):
+            if len(xml) > _STREAM_PARSE_THRESHOLD:
+                return self._parse_pruned(io.BytesIO(xml))
+            return ET.fromstring(xml)
+        if os.path.getsize(xml) > _STREAM_PARSE_THRESHOLD:
+            return self._parse_pruned(xml)
+        return ET.parse(xml).getroot()
+
+    def _parse_pruned(self, source) -> _Element:
+        """
+        Parse a large XML document, keeping only what the checks read.
 
-        return None
+        Elements are cleared as soon as they are complete if no check uses
+        them: <properties> blocks and non-fragment shader stages. This keeps
+        memory close to the size of the params and fragment shader sources
+        rather than the whole document.
 
-    def check_structure(self, xml_path: Path) -> FileAnalysisResult:
+        Args:
+            source: File path or binary file object containing the XML
+
+        Returns:
+            Root element of the pruned document
+        """
+        events = ET.iterparse(source, events=("end",))
+        for _, elem in events:
+            tag = elem.tag
+            if tag == "properties" or (tag == "stage" and elem.get("type") != "FRAGMENT"):
+                elem.clear()
+        return events.root
+
+    def check_structure(self, xml_path: XMLSource) -> FileAnalysisResult:
         """
         Check XML structure for basic validity.
 
         Args:
-            xml_path: Path to extracted XML file
+            xml_path: Path to extracted XML file, XML bytes, or parsed root element
 
         Returns:
             FileAnalysisResult with structural issues
         """
-        result = FileAnalysisResult(file_path=xml_path)
+        result = FileAnalysisResult(file_path=_result_path(xml_path))
 
         try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
+            root = self._parse_root(xml_path)
 
             # Check root element
             if root.tag != "klxml":
@@ -375,34 +509,52 @@ class KlprojAnalyzer:
 
         return result
 
-    def check_uniforms(self, xml_path: Path) -> FileAnalysisResult:
+    def _collect_global_params(self, document: _Element) -> List[str]:
+        """
+        Collect the variable names of a document's global parameters.
+
+        Args:
+            document: The <document> element
+
+        Returns:
+            Non-empty parameter variable names, in document order
+        """
+        params_elem = document.find("params")
+        if params_elem is None:
+            return []
+        return [
+            name_elem.text
+            for name_elem in params_elem.iterfind("param/variableName")
+            if name_elem.text
+        ]
+
+    def check_uniforms(
+        self, xml_path: XMLSource, global_params: Optional[List[str]] = None
+    ) -> FileAnalysisResult:
         """
         Check for missing uniform declarations in shaders.
 
         Args:
-            xml_path: Path to extracted XML file
+            xml_path: Path to extracted XML file, XML bytes, or parsed root element
+            global_params: Global parameter names from _collect_global_params(),
+                if already known; collected from the document otherwise
 
         Returns:
             FileAnalysisResult with uniform-related issues
         """
-        result = FileAnalysisResult(file_path=xml_path)
+        result = FileAnalysisResult(file_path=_result_path(xml_path))
 
         try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
+            root = self._parse_root(xml_path)
             document = root.find("document")
 
             if document is None:
                 return result
 
             # Get global parameter names
-            params_elem = document.find("params")
-            param_names = []
-            if params_elem is not None:
-                for param in params_elem.findall("param"):
-                    var_name_elem = param.find("variableName")
-                    if var_name_elem is not None and var_name_elem.text:
-                        param_names.append(var_name_elem.text)
+            param_names = global_params
+            if param_names is None:
+                param_names = self._collect_global_params(document)
 
             # Check each pass
             passes_elem = document.find("passes")
@@ -413,16 +565,7 @@ class KlprojAnalyzer:
                 result.info[f"pass_{i}_type"] = pass_elem.get("type", "UNKNOWN")
 
                 # Find fragment shader
-                stages_elem = pass_elem.find("stages")
-                if stages_elem is None:
-                    continue
-
-                frag_stage = None
-                for stage in stages_elem.findall("stage"):
-                    if stage.get("type") == "FRAGMENT":
-                        frag_stage = stage
-                        break
-
+                frag_stage = pass_elem.find(_FRAGMENT_STAGE_PATH)
                 if frag_stage is None:
                     continue
 
@@ -447,8 +590,8 @@ class KlprojAnalyzer:
                         )
                     )
 
-                # Check for main function
-                if "void main()" not in shader_code and "void main(" not in shader_code:
+                # Check for main function ("void main(" also covers "void main()")
+                if "void main(" not in shader_code:
                     result.issues.append(
                         AnalysisIssue(
                             severity="error",
@@ -459,9 +602,7 @@ class KlprojAnalyzer:
                     )
 
                 # Check for output variable
-                has_frag_color = "fragColor" in shader_code
-                has_gl_frag_color = "gl_FragColor" in shader_code
-                if not has_frag_color and not has_gl_frag_color:
+                if "fragColor" not in shader_code and "gl_FragColor" not in shader_code:
                     result.issues.append(
                         AnalysisIssue(
                             severity="warning",
@@ -483,30 +624,20 @@ class KlprojAnalyzer:
                     )
 
                 # Check specific uniforms match global parameters
+                declared = _declared_uniforms(shader_code)
                 for param in param_names:
-                    if param in shader_code:
-                        # Parameter is used in shader, check for declaration
-                        uniform_patterns = [
-                            f"uniform float {param}",
-                            f"uniform vec2 {param}",
-                            f"uniform vec3 {param}",
-                            f"uniform vec4 {param}",
-                            f"uniform highp float {param}",
-                            f"uniform highp vec2 {param}",
-                        ]
-
-                        has_uniform = any(pattern in shader_code for pattern in uniform_patterns)
-
-                        if not has_uniform:
-                            result.issues.append(
-                                AnalysisIssue(
-                                    severity="warning",
-                                    category="uniforms",
-                                    message=f"Parameter '{param}' used but no uniform declaration found",
-                                    pass_index=i,
-                                    details={"parameter": param},
-                                )
+                    # Undeclared parameter that the shader uses. The set lookup
+                    # goes first so declared parameters never scan the source.
+                    if param not in declared and param in shader_code:
+                        result.issues.append(
+                            AnalysisIssue(
+                                severity="warning",
+                                category="uniforms",
+                                message=f"Parameter '{param}' used but no uniform declaration found",
+                                pass_index=i,
+                                details={"parameter": param},
                             )
+                        )
 
         except Exception as e:
             result.issues.append(
@@ -519,59 +650,46 @@ class KlprojAnalyzer:
 
         return result
 
-    def _extract_shader_variables(self, shader_code: str) -> Dict[str, Set[str]]:
+    def _extract_shader_variables(self, shader_code: str) -> Dict[str, FrozenSet[str]]:
         """Extract declared and used variables from shader code."""
-        # Find uniform declarations
-        uniform_pattern = r"uniform\s+(?:highp|mediump|lowp)?\s*(\w+)\s+(\w+)"
-        uniforms = {match[1] for match in re.findall(uniform_pattern, shader_code)}
-
-        # Find const declarations
-        const_pattern = r"const\s+(?:highp|mediump|lowp)?\s*\w+\s+(\w+)"
-        consts = set(re.findall(const_pattern, shader_code))
-
-        # Remove comments and strings
-        code_clean = re.sub(r"//.*$", "", shader_code, flags=re.MULTILINE)
-        code_clean = re.sub(r"/\*.*?\*/", "", code_clean, flags=re.DOTALL)
-
-        # Find potential variable uses
-        identifier_pattern = r"\b([a-zA-Z_][a-zA-Z0-9_]*)\b"
-        potential_vars = re.findall(identifier_pattern, code_clean)
-
-        var_uses = {v for v in potential_vars if v not in self.glsl_keywords and v not in consts}
-
-        return {"uniforms": uniforms, "consts": consts, "potential_uses": var_uses}
+        uniforms, consts, var_uses = _shader_variables(shader_code)
+        return {
+            "uniforms": uniforms,
+            "consts": consts,
+            "potential_uses": var_uses - self.glsl_keywords,
+        }
 
     def check_undefined_vars(
-        self, xml_path: Path, isf_path: Optional[Path] = None
+        self,
+        xml_path: XMLSource,
+        isf_path: Optional[Path] = None,
+        global_params: Optional[List[str]] = None,
     ) -> FileAnalysisResult:
         """
         Deep analysis for undefined variables in shaders.
 
         Args:
-            xml_path: Path to extracted XML file
+            xml_path: Path to extracted XML file, XML bytes, or parsed root element
             isf_path: Optional path to original ISF file for enhanced analysis
+            global_params: Global parameter names from _collect_global_params(),
+                if already known; collected from the document otherwise
 
         Returns:
             FileAnalysisResult with undefined variable issues
         """
-        result = FileAnalysisResult(file_path=xml_path)
+        result = FileAnalysisResult(file_path=_result_path(xml_path))
 
         try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
+            root = self._parse_root(xml_path)
             document = root.find("document")
 
             if document is None:
                 return result
 
             # Get global parameters
-            params_elem = document.find("params")
-            global_params = set()
-            if params_elem is not None:
-                for param in params_elem.findall("param"):
-                    var_name_elem = param.find("variableName")
-                    if var_name_elem is not None and var_name_elem.text:
-                        global_params.add(var_name_elem.text)
+            if global_params is None:
+                global_params = self._collect_global_params(document)
+            global_params = set(global_params)
 
             # Check each pass
             passes_elem = document.find("passes")
@@ -580,16 +698,7 @@ class KlprojAnalyzer:
 
             for i, pass_elem in enumerate(passes_elem.findall("pass")):
                 # Find fragment shader
-                stages_elem = pass_elem.find("stages")
-                if stages_elem is None:
-                    continue
-
-                frag_stage = None
-                for stage in stages_elem.findall("stage"):
-                    if stage.get("type") == "FRAGMENT":
-                        frag_stage = stage
-                        break
-
+                frag_stage = pass_elem.find(_FRAGMENT_STAGE_PATH)
                 if frag_stage is None:
                     continue
 
@@ -649,9 +758,9 @@ class KlprojAnalyzer:
             Combined FileAnalysisResult
         """
         # Extract to XML
-        xml_path = self.extract_to_xml(klproj_path)
+        xml_data = self.extract_to_xml(klproj_path)
 
-        if xml_path is None:
+        if xml_data is None:
             result = FileAnalysisResult(file_path=klproj_path)
             result.issues.append(
                 AnalysisIssue(
@@ -662,51 +771,100 @@ class KlprojAnalyzer:
             )
             return result
 
+        # Parse once and share the tree across all checks. If parsing fails,
+        # hand each check the raw XML so it reports the error in its category.
+        try:
+            xml_doc = self._parse_root(xml_data)
+        except ET.ParseError:
+            xml_doc = xml_data
+
+        # Both shader checks need the global parameter names; collect them once
+        global_params = None
+        if xml_doc is not xml_data:
+            document = xml_doc.find("document")
+            if document is not None:
+                global_params = self._collect_global_params(document)
+
         # Combine results from all checks
         combined_result = FileAnalysisResult(file_path=klproj_path)
 
-        try:
-            for check in checks:
-                if check == "structure":
-                    check_result = self.check_structure(xml_path)
-                elif check == "uniforms":
-                    check_result = self.check_uniforms(xml_path)
-                elif check == "undefined_vars":
-                    check_result = self.check_undefined_vars(xml_path)
-                else:
-                    continue
-
-                combined_result.issues.extend(check_result.issues)
-                combined_result.info.update(check_result.info)
+        for check in checks:
+            if check == "structure":
+                check_result = self.check_structure(xml_doc)
+            elif check == "uniforms":
+                check_result = self.check_uniforms(xml_doc, global_params=global_params)
+            elif check == "undefined_vars":
+                check_result = self.check_undefined_vars(xml_doc, global_params=global_params)
+            else:
+                continue
 
-        finally:
-            # Clean up XML file
-            if xml_path.exists():
-                xml_path.unlink()
+            combined_result.issues.extend(check_result.issues)
+            combined_result.info.update(check_result.info)
 
         return combined_result
 
     def analyze_batch(
-        self, files: List[Path], checks: List[str], reporter: Optional[Callable] = None
+        self,
+        files: List[Path],
+        checks: List[str],
+        reporter: Optional[Callable] = None,
+        max_workers: int = 1,
     ) -> BatchAnalysisResult:
         """
         Analyze multiple .klproj files.
 
+        With max_workers > 1, files are analyzed in parallel across a
+        process pool; progress is still reported and results stored in input
+        order.
+
         Args:
             files: List of .klproj file paths
             checks: List of checks to run
+            reporter: Optional progress reporter callback, called with
+                (index, total, filename) as each file's analysis is collected
+            max_workers: Maximum number of worker processes (default: 1, which
+                analyzes serially in the current process)
+
+        Returns:
+            BatchAnalysisResult
+        """
+        max_workers = min(max_workers, len(files))
+
+        if max_workers <= 1:
+            results = map(self.analyze_file, files, itertools.repeat(checks))
+            return self._collect_batch(files, results, reporter)
+
+        # Hand each worker several files at a time to amortize IPC overhead
+        chunksize = max(1, len(files) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                self.analyze_file, files, itertools.repeat(checks), chunksize=chunksize
+            )
+            return self._collect_batch(files, results, reporter)
+
+    def _collect_batch(
+        self,
+        files: List[Path],
+        results: Iterable[FileAnalysisResult],
+        reporter: Optional[Callable] = None,
+    ) -> BatchAnalysisResult:
+        """
+        Gather per-file results into a BatchAnalysisResult, in input order.
+
+        Args:
+            files: List of .klproj file paths
+            results: Analysis results corresponding to files
             reporter: Optional progress reporter callback
 
         Returns:
             BatchAnalysisResult
         """
         batch_result = BatchAnalysisResult()
+        total = len(files)
 
-        for i, file_path in enumerate(files, 1):
+        for i, (file_path, result) in enumerate(zip(files, results, strict=True), 1):
             if reporter:
-                reporter(i, len(files), file_path.name)
-
-            result = self.analyze_file(file_path, checks, reporter)
+                reporter(i, total, file_path.name)
             batch_result.file_results[file_path.name] = result
 
         return batch_result
@@ -5,16 +5,63 @@ This module provides functionality to convert multiple ISF files to .klproj form
 with progress tracking, error handling, and result reporting.
 """
 
-import json
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, List, Optional, Union
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
 from ..isf_converter import convert_isf_to_kodelife
+from ._json import _write_json
 from .isf_discovery import ISFInfo
 
+# Maps ASCII characters not allowed in output filenames to "_"
+_SANITIZE_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if not (c.isalnum() or c in "-_")}
+)
 
-@dataclass
+# (success, output_path, error_message), as returned by BatchConverter.convert_file()
+FileOutcome = Tuple[bool, Optional[Path], Optional[str]]
+
+
+def _convert_one(
+    input_path: Path, output_path: Path, api: str, width: int, height: int
+) -> FileOutcome:
+    """
+    Convert one ISF file (module-level so it can run in a worker process).
+
+    Args:
+        input_path: Path to input ISF file
+        output_path: Path to output .klproj file
+        api: Graphics API to use
+        width: Project width in pixels
+        height: Project height in pixels
+
+    Returns:
+        Tuple of (success, output_path, error_message)
+    """
+    try:
+        result_path = convert_isf_to_kodelife(
+            isf_file_path=str(input_path),
+            output_path=str(output_path),
+            api=api,
+            width=width,
+            height=height,
+        )
+
+        return True, Path(result_path), None
+
+    except FileNotFoundError as e:
+        # The input is not checked up front; opening it reports a missing file
+        if e.filename == str(input_path):
+            return False, None, f"File not found: {input_path}"
+        return False, None, str(e)
+
+    except Exception as e:
+        return False, None, str(e)
+
+
+@dataclass(slots=True)
 class ConversionResult:
     """Results from batch conversion."""
 
@@ -63,10 +110,10 @@ class ConversionResult:
         }
 
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        if not output_file.parent.is_dir():
+            output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, "w") as f:
-            json.dump(data, f, indent=2)
+        _write_json(output_file, data)
 
 
 class BatchConverter:
@@ -84,6 +131,7 @@ class BatchConverter:
         width: int = 1920,
         height: int = 1080,
         overwrite: bool = False,
+        max_workers: int = 1,
     ):
         """
         Initialize batch converter.
@@ -94,12 +142,15 @@ class BatchConverter:
             width: Project width in pixels
             height: Project height in pixels
             overwrite: Whether to overwrite existing .klproj files
+            max_workers: Number of worker processes for convert_batch()
+                (default: 1, convert serially in the current process)
         """
         self.output_dir = Path(output_dir)
         self.api = api
         self.width = width
         self.height = height
         self.overwrite = overwrite
+        self.max_workers = max_workers
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -114,6 +165,9 @@ class BatchConverter:
         Returns:
             Sanitized filename with only alphanumeric, dash, and underscore characters
         """
+        if filename.isascii():
+            return filename.translate(_SANITIZE_TABLE)
+        # Non-ASCII letters and digits are kept as well
         return "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in filename)
 
     def _get_output_path(self, input_path: Path) -> Path:
@@ -149,35 +203,35 @@ class BatchConverter:
         else:
             input_path = Path(input_file)
 
-        # Check if file exists
-        if not input_path.exists():
-            return False, None, f"File not found: {input_path}"
-
         # Determine output path
         output_path = self._get_output_path(input_path)
 
+        error = self._check_paths(input_path, output_path)
+        if error is not None:
+            return False, None, error
+
+        # Convert the file
+        return _convert_one(input_path, output_path, self.api, self.width, self.height)
+
+    def _check_paths(self, input_path: Path, output_path: Path) -> Optional[str]:
+        """
+        Check that a file can be converted to the given output path.
+
+        A missing input file is not checked here; converting it fails with
+        the same "File not found" error, which saves a stat per file.
+
+        Args:
+            input_path: Path to input ISF file
+            output_path: Path to output .klproj file
+
+        Returns:
+            Error message, or None if conversion can proceed
+        """
         # Check if output already exists and we're not overwriting
-        if output_path.exists() and not self.overwrite:
-            return (
-                False,
-                None,
-                "Output file already exists (use --overwrite to replace)",
-            )
-
-        try:
-            # Convert the file
-            result_path = convert_isf_to_kodelife(
-                isf_file_path=str(input_path),
-                output_path=str(output_path),
-                api=self.api,
-                width=self.width,
-                height=self.height,
-            )
-
-            return True, Path(result_path), None
-
-        except Exception as e:
-            return False, None, str(e)
+        if not self.overwrite and os.path.exists(output_path):
+            return "Output file already exists (use --overwrite to replace)"
+
+        return None
 
     def convert_batch(
         self,
@@ -188,15 +242,100 @@ class BatchConverter:
         """
         Convert a batch of ISF files.
 
+        With max_workers > 1, files are converted in parallel across a
+        process pool; progress is still reported and results stored in input
+        order. Stopping at the first error (continue_on_error=False) always
+        converts serially, so no file after the failure is written.
+
         Args:
             files: List of file paths or ISFInfo objects to convert
             reporter: Optional callback for progress reporting (called with index, total, filename)
             continue_on_error: Whether to continue processing after errors
 
+        Returns:
+            ConversionResult object with success/failure information
+        """
+        if self.max_workers <= 1 or len(files) <= 1 or not continue_on_error:
+            # Serial conversion, also used when stopping at the first error
+            outcomes = (self.convert_file(file_item, reporter) for file_item in files)
+            return self._collect_batch(files, outcomes, reporter, continue_on_error)
+
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(files))) as executor:
+            outcomes = self._submit_batch(executor, files)
+            return self._collect_batch(files, outcomes, reporter, continue_on_error)
+
+    def _submit_batch(
+        self, executor: ProcessPoolExecutor, files: List[Union[Path, ISFInfo]]
+    ) -> Iterable[FileOutcome]:
+        """
+        Submit a batch of conversions to a process pool.
+
+        Files are checked up front and converted in parallel. A file whose
+        output path was already claimed by an earlier file in the batch is
+        converted in order once the earlier one is done, as in a serial run.
+
+        Args:
+            executor: Process pool to run conversions on
+            files: List of file paths or ISFInfo objects to convert
+
+        Returns:
+            Iterator of per-file outcomes, in input order
+        """
+        jobs: List[Union[Future, FileOutcome, None]] = []
+        claimed = set()
+
+        for file_item in files:
+            input_path = file_item.path if isinstance(file_item, ISFInfo) else Path(file_item)
+            output_path = self._get_output_path(input_path)
+
+            if output_path in claimed:
+                jobs.append(None)
+                continue
+            claimed.add(output_path)
+
+            error = self._check_paths(input_path, output_path)
+            if error is not None:
+                jobs.append((False, None, error))
+            else:
+                jobs.append(
+                    executor.submit(
+                        _convert_one, input_path, output_path, self.api, self.width, self.height
+                    )
+                )
+
+        def outcomes():
+            for file_item, job in zip(files, jobs, strict=True):
+                if job is None:
+                    yield self.convert_file(file_item)
+                elif isinstance(job, Future):
+                    yield job.result()
+                else:
+                    yield job
+
+        return outcomes()
+
+    def _collect_batch(
+        self,
+        files: List[Union[Path, ISFInfo]],
+        outcomes: Iterable[FileOutcome],
+        reporter: Optional[Callable] = None,
+        continue_on_error: bool = True,
+    ) -> ConversionResult:
+        """
+        Gather per-file outcomes into a ConversionResult, in input order.
+
+        Args:
+            files: List of file paths or ISFInfo objects that were converted
+            outcomes: Lazy iterator of outcomes corresponding to files; each is
+                taken after the file's progress has been reported
+            reporter: Optional callback for progress reporting
+            continue_on_error: Whether to continue processing after errors
+
         Returns:
             ConversionResult object with success/failure information
         """
         result = ConversionResult()
+        outcomes = iter(outcomes)
 
         for i, file_item in enumerate(files, 1):
             # Get file path and name
@@ -212,7 +351,7 @@ class BatchConverter:
                 reporter(i, len(files), display_name, file_item)
 
             # Convert file
-            success, output_path, error = self.convert_file(file_item, reporter)
+            success, output_path, error = next(outcomes)
 
             if success:
                 result.successful.append(output_path)
@@ -230,13 +369,18 @@ class BatchConverter:
         Returns:
             Dictionary with statistics about converted files
         """
-        klproj_files = list(self.output_dir.glob("*.klproj"))
-
-        total_size = sum(f.stat().st_size for f in klproj_files)
+        # One directory read; DirEntry caches the stat result per file
+        file_count = 0
+        total_size = 0
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".klproj") and entry.is_file():
+                    file_count += 1
+                    total_size += entry.stat().st_size
 
         return {
             "output_dir": str(self.output_dir),
-            "file_count": len(klproj_files),
+            "file_count": file_count,
             "total_size_bytes": total_size,
             "total_size_mb": total_size / (1024 * 1024),
             "api": self.api,
@@ -5,15 +5,83 @@ This module provides functionality to scan directories for ISF shader files,
 identify multipass vs single-pass shaders, and select files based on various criteria.
 """
 
+import codecs
+import functools
 import json
+import os
 import random
-import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+from ..isf_parser import find_isf_header_bounds
+from ._json import _write_json
 
-@dataclass
+# Prefer orjson for parsing metadata headers when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bytes read from each shader when looking for its metadata header. The
+# header is at the top of the file, so this almost always covers it; if not,
+# the rest of the file is read.
+_HEADER_READ_SIZE = 64 * 1024
+
+# Bumped whenever the layout of cached entries changes
+_CACHE_VERSION = 2
+
+# Cached ISFInfo fields: is_multipass, passes, description, categories, inputs
+_CACHE_FIELD_COUNT = 5
+
+
+def default_cache_path() -> Optional[Path]:
+    """
+    Get the default location of the scan cache used by the command-line tools.
+
+    Follows the XDG base directory spec: $XDG_CACHE_HOME/klproj/isf_index.json,
+    or ~/.cache/klproj/isf_index.json if XDG_CACHE_HOME is unset or relative.
+
+    Returns:
+        Path to the cache file, or None if the home directory cannot be resolved
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if cache_home and os.path.isabs(cache_home):
+        base = Path(cache_home)
+    else:
+        try:
+            base = Path.home() / ".cache"
+        except RuntimeError:
+            return None
+    return base / "klproj" / "isf_index.json"
+
+
+def _parse_metadata(json_str: str) -> Optional[dict]:
+    """
+    Parse ISF header JSON.
+
+    Args:
+        json_str: JSON text of the ISF metadata header
+
+    Returns:
+        Parsed JSON metadata or None if invalid
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. no NaN); let json decide
+            pass
+
+    try:
+        return json.loads(json_str)
+    except json.JSONDecodeError:
+        return None
+
+
+@dataclass(slots=True)
 class ISFInfo:
     """Information about an ISF shader file."""
 
@@ -24,6 +92,14 @@ class ISFInfo:
     categories: List[str] = field(default_factory=list)
     inputs: List[dict] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Category names repeat across shader collections; intern them
+        categories = self.categories
+        if isinstance(categories, list):
+            for i, cat in enumerate(categories):
+                if isinstance(cat, str):
+                    categories[i] = sys.intern(cat)
+
     @property
     def name(self) -> str:
         """Get the filename without extension."""
@@ -43,37 +119,325 @@ class ISFDiscovery:
     and provides methods for filtering and selecting files.
     """
 
-    def __init__(self, base_dirs: Optional[List[str]] = None):
+    def __init__(
+        self,
+        base_dirs: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        cache_path: Optional[str] = None,
+    ):
         """
         Initialize ISF discovery.
 
         Args:
             base_dirs: List of directories to search. If None, uses default locations.
+            max_workers: Maximum number of threads reading shader files during a
+                scan (default: 4 per CPU, up to 32). Use 1 to read serially.
+            cache_path: Optional JSON file caching each file's metadata between
+                runs. Files whose size and modification time are unchanged are
+                not read again. If None, every scan reads all files.
         """
         if base_dirs is None:
             base_dirs = ["/Users/andre/Library/Graphics/ISF"]
 
         self.base_dirs = [Path(d) for d in base_dirs]
+        self.max_workers = max_workers
+        self.cache_path = Path(cache_path) if cache_path is not None else None
         self._multipass_cache: Optional[List[ISFInfo]] = None
         self._single_pass_cache: Optional[List[ISFInfo]] = None
 
+    def _extract_isf_header(self, shader_text: str) -> Optional[str]:
+        """
+        Extract the JSON metadata header from ISF shader.
+
+        The header is located the same way parse_isf_string() does, so any file
+        discovered here can be parsed by the converter.
+
+        Args:
+            shader_text: ISF shader source, or a prefix of it containing the header
+
+        Returns:
+            JSON text of the header, or None if not found
+        """
+        bounds = find_isf_header_bounds(shader_text)
+        if bounds is None:
+            return None
+
+        json_start, json_end, _ = bounds
+        return shader_text[json_start:json_end]
+
     def _extract_isf_metadata(self, shader_text: str) -> Optional[dict]:
         """
         Extract JSON metadata from ISF shader.
 
         Args:
-            shader_text: The full ISF shader source code
+            shader_text: ISF shader source, or a prefix of it containing the header
 
         Returns:
             Parsed JSON metadata or None if not found/invalid
         """
-        match = re.match(r"/\*\s*(\{.*?\})\s*\*/", shader_text, re.DOTALL)
-        if match:
+        json_str = self._extract_isf_header(shader_text)
+        return None if json_str is None else _parse_metadata(json_str)
+
+    def _read_isf_header(self, file_path: Path) -> Optional[str]:
+        """
+        Read the JSON metadata header of an ISF file.
+
+        Only the first _HEADER_READ_SIZE bytes are read unless the header
+        extends past them, and files that do not start with "/*" are rejected
+        before any text is decoded.
+
+        Args:
+            file_path: Path to the shader file
+
+        Returns:
+            JSON text of the header, or None if not found
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the text read is not valid UTF-8
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        with open(file_path, "rb") as f:
+            chunk = f.read(_HEADER_READ_SIZE)
+            if not chunk.startswith(b"/*"):
+                return None
+            if len(chunk) < _HEADER_READ_SIZE:
+                return self._extract_isf_header(decoder.decode(chunk, final=True))
+
+            # An incomplete trailing UTF-8 sequence is held back by the decoder
+            text = decoder.decode(chunk)
+            if find_isf_header_bounds(text) is None:
+                text += decoder.decode(f.read(), final=True)
+
+        return self._extract_isf_header(text)
+
+    def _walk(self, base_dir: Path, extensions: Tuple[str, ...]) -> Iterator[Tuple[str, Path]]:
+        """
+        Recursively find files with the given extensions in a single pass.
+
+        Each directory is read once with os.scandir(), whose entries carry the
+        file type, so no per-file stat is needed. Files are visited in the
+        same order as Path.rglob(): a directory's files, then its
+        subdirectories depth-first. Symlinked directories are not followed.
+
+        Args:
+            base_dir: Directory to search
+            extensions: File extensions to accept
+
+        Yields:
+            Tuples of (matched extension, file path)
+        """
+        try:
+            with os.scandir(base_dir) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            if name.endswith(extensions):
+                for ext in extensions:
+                    if name.endswith(ext):
+                        yield ext, Path(entry.path)
+                        break
             try:
-                return json.loads(match.group(1))
-            except json.JSONDecodeError:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+
+        for subdir in subdirs:
+            yield from self._walk(subdir, extensions)
+
+    def _classify_file(self, file_path: Path) -> Optional[ISFInfo]:
+        """
+        Read an ISF file's metadata.
+
+        Args:
+            file_path: Path to a candidate shader file
+
+        Returns:
+            ISFInfo for the shader, or None if the file has no readable ISF metadata
+        """
+        try:
+            json_str = self._read_isf_header(file_path)
+            metadata = None if json_str is None else _parse_metadata(json_str)
+
+            if metadata is None:
+                # File doesn't have ISF metadata, skip it
                 return None
-        return None
+
+            categories = metadata.get("CATEGORIES", [])
+            if not isinstance(categories, list):
+                # e.g. "CATEGORIES": null
+                categories = []
+
+            return ISFInfo(
+                path=file_path,
+                # Check for PASSES (multipass shader)
+                is_multipass="PASSES" in metadata,
+                passes=metadata.get("PASSES", []),
+                description=metadata.get("DESCRIPTION", ""),
+                categories=categories,
+                inputs=metadata.get("INPUTS", []),
+            )
+
+        except Exception:
+            # Skip files that can't be read or parsed
+            return None
+
+    def _classify_cached(
+        self, file_path: Path, cached: Dict[str, list], entries: Dict[str, list]
+    ) -> Optional[ISFInfo]:
+        """
+        Classify a file, reusing its cached entry if the file is unchanged.
+
+        Args:
+            file_path: Path to a candidate shader file
+            cached: Entries loaded from the cache file
+            entries: Entries for the updated cache file, filled in by this call
+
+        Returns:
+            ISFInfo for the shader, or None if the file has no readable ISF metadata
+        """
+        key = os.path.abspath(file_path)
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+
+        entry = cached.get(key)
+        isf_info = None
+        fresh = (
+            isinstance(entry, list)
+            and len(entry) == 3
+            and entry[0] == st.st_mtime_ns
+            and entry[1] == st.st_size
+        )
+        if fresh and entry[2] is not None:
+            fields = entry[2]
+            if isinstance(fields, list) and len(fields) == _CACHE_FIELD_COUNT:
+                isf_info = ISFInfo(file_path, *fields)
+            else:
+                # Malformed entry; read the file again
+                fresh = False
+
+        if not fresh:
+            isf_info = self._classify_file(file_path)
+            if isf_info is None:
+                fields = None
+            else:
+                fields = [
+                    isf_info.is_multipass,
+                    isf_info.passes,
+                    isf_info.description,
+                    isf_info.categories,
+                    isf_info.inputs,
+                ]
+            entry = [st.st_mtime_ns, st.st_size, fields]
+
+        entries[key] = entry
+        return isf_info
+
+    def _load_cache(self) -> Dict[str, list]:
+        """
+        Load cached file entries from cache_path.
+
+        Returns:
+            Dict mapping absolute file paths to [mtime_ns, size, fields] entries;
+            empty if the cache is missing, unreadable or from another version
+        """
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = f.read()
+            cache = orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+            return {}
+        files = cache.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _merge_cache(
+        self, cached: Dict[str, list], entries: Dict[str, list], extensions: Tuple[str, ...]
+    ) -> Dict[str, list]:
+        """
+        Merge the entries from a scan into the previously cached entries.
+
+        The cache file can be shared by scans of different directories, so
+        entries outside this scan's base directories are kept. Entries inside
+        them that the scan did not visit belong to deleted files and are dropped.
+
+        Args:
+            cached: Entries loaded from the cache file
+            entries: Entries for the files visited by this scan
+            extensions: File extensions this scan searched for
+
+        Returns:
+            Dict of entries to write back to the cache file
+        """
+        roots = tuple(os.path.join(os.path.abspath(d), "") for d in self.base_dirs)
+        merged = {
+            key: entry
+            for key, entry in cached.items()
+            if not (key.startswith(roots) and key.endswith(extensions))
+        }
+        merged.update(entries)
+        return merged
+
+    def _save_cache(self, entries: Dict[str, list]):
+        """
+        Write file entries to cache_path.
+
+        The cache is only an optimization, so failures to write it are ignored.
+
+        Args:
+            entries: Dict mapping absolute file paths to [mtime_ns, size, fields]
+        """
+        cache = {"version": _CACHE_VERSION, "files": entries}
+        if orjson is not None:
+            data = orjson.dumps(cache)
+        else:
+            data = json.dumps(cache).encode("utf-8")
+
+        # Write to a temporary file and rename it, so concurrent runs never
+        # see a partially written cache
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _partition(
+        self, results: Iterable[Optional[ISFInfo]]
+    ) -> tuple[List[ISFInfo], List[ISFInfo]]:
+        """
+        Split classified files into multipass and single-pass shaders.
+
+        Args:
+            results: _classify_file() results, in scan order
+
+        Returns:
+            Tuple of (multipass_shaders, single_pass_shaders)
+        """
+        multipass = []
+        single_pass = []
+        for isf_info in results:
+            if isf_info is None:
+                continue
+            if isf_info.is_multipass:
+                multipass.append(isf_info)
+            else:
+                single_pass.append(isf_info)
+        return multipass, single_pass
 
     def scan(self, extensions: Optional[List[str]] = None) -> tuple[List[ISFInfo], List[ISFInfo]]:
         """
@@ -88,47 +452,40 @@ class ISFDiscovery:
         if extensions is None:
             extensions = [".fs", ".frag", ".glsl"]
 
-        multipass = []
-        single_pass = []
-
+        # Find all ISF files in one walk per directory, grouped by extension
+        file_paths: List[Path] = []
         for base_dir in self.base_dirs:
             if not base_dir.exists():
                 continue
 
-            # Find all ISF files
-            for ext in extensions:
-                pattern = f"*{ext}"
-                for file_path in base_dir.rglob(pattern):
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-
-                        metadata = self._extract_isf_metadata(content)
-
-                        if metadata is None:
-                            # File doesn't have ISF metadata, skip it
-                            continue
-
-                        # Check for PASSES (multipass shader)
-                        is_multipass = "PASSES" in metadata
-
-                        isf_info = ISFInfo(
-                            path=file_path,
-                            is_multipass=is_multipass,
-                            passes=metadata.get("PASSES", []),
-                            description=metadata.get("DESCRIPTION", ""),
-                            categories=metadata.get("CATEGORIES", []),
-                            inputs=metadata.get("INPUTS", []),
-                        )
-
-                        if is_multipass:
-                            multipass.append(isf_info)
-                        else:
-                            single_pass.append(isf_info)
-
-                    except Exception:
-                        # Skip files that can't be read or parsed
-                        continue
+            files_by_ext: Dict[str, List[Path]] = {ext: [] for ext in extensions}
+            for ext, file_path in self._walk(base_dir, tuple(extensions)):
+                files_by_ext[ext].append(file_path)
+            for paths in files_by_ext.values():
+                file_paths.extend(paths)
+
+        # Reading headers is I/O bound, so overlap it across threads
+        max_workers = self.max_workers
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        max_workers = min(max_workers, len(file_paths))
+
+        classify = self._classify_file
+        if self.cache_path is not None:
+            cached = self._load_cache()
+            entries: Dict[str, list] = {}
+            classify = functools.partial(self._classify_cached, cached=cached, entries=entries)
+
+        if max_workers <= 1:
+            results = map(classify, file_paths)
+            multipass, single_pass = self._partition(results)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(classify, file_paths)
+                multipass, single_pass = self._partition(results)
+
+        if self.cache_path is not None:
+            self._save_cache(self._merge_cache(cached, entries, tuple(extensions)))
 
         # Cache results
         self._multipass_cache = multipass
@@ -175,10 +532,10 @@ class ISFDiscovery:
         """
         multipass, single_pass = self.get_cached()
 
-        selected_multi = self.select_random(num_multipass, multipass)
-        selected_single = self.select_random(num_single, single_pass)
-
-        combined = selected_multi + selected_single
+        # select_random() always returns a new list, so extend and shuffle it
+        # in place rather than concatenating into another copy
+        combined = self.select_random(num_multipass, multipass)
+        combined.extend(self.select_random(num_single, single_pass))
         random.shuffle(combined)
 
         return combined
@@ -194,10 +551,13 @@ class ISFDiscovery:
         Returns:
             Filtered list of ISFInfo objects
         """
+        q = category.lower()
+        # any() stops at the first matching category; non-string entries in
+        # hand-written metadata never match
         return [
             shader
             for shader in shader_list
-            if category.lower() in [cat.lower() for cat in shader.categories]
+            if any(isinstance(cat, str) and cat.lower() == q for cat in shader.categories)
         ]
 
     def save_to_json(self, output_path: str):
@@ -228,5 +588,4 @@ class ISFDiscovery:
             },
         }
 
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        _write_json(output_path, data)
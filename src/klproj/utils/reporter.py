@@ -7,11 +7,14 @@ results summaries, and formatted output.
 
 import sys
 from pathlib import Path
-from typing import Union
+from typing import List, Union
 
 from .batch_processor import ConversionResult
 from .isf_discovery import ISFInfo
 
+# Per-file progress lines written to stdout in one call
+_PROGRESS_LINES_PER_WRITE = 32
+
 
 class ConversionReporter:
     """
@@ -19,6 +22,10 @@ class ConversionReporter:
 
     Provides formatted console output with progress indicators,
     status messages, and summary statistics.
+
+    Per-file progress lines are buffered and written to stdout in batches;
+    any other output flushes the buffer first, so ordering is preserved. Call
+    flush() when done reporting progress without printing a summary.
     """
 
     def __init__(self, verbose: bool = False, quiet: bool = False):
@@ -34,6 +41,23 @@ class ConversionReporter:
         self._current_file = 0
         self._total_files = 0
 
+        # Verbose interactive sessions get each line immediately
+        interactive = getattr(sys.stdout, "isatty", lambda: False)()
+        self._lines_per_write = 1 if verbose and interactive else _PROGRESS_LINES_PER_WRITE
+        self._buffer: List[str] = []
+
+    def _write_progress(self, line: str):
+        """Buffer a per-file progress line for stdout."""
+        self._buffer.append(line + "\n")
+        if len(self._buffer) >= self._lines_per_write:
+            self.flush()
+
+    def flush(self):
+        """Write any buffered progress lines to stdout."""
+        if self._buffer:
+            sys.stdout.write("".join(self._buffer))
+            self._buffer.clear()
+
     def print_header(self, title: str, width: int = 80):
         """
         Print a formatted header.
@@ -42,6 +66,7 @@ class ConversionReporter:
             title: Header title text
             width: Total width of header in characters
         """
+        self.flush()
         if self.quiet:
             return
 
@@ -57,6 +82,7 @@ class ConversionReporter:
             title: Section title
             width: Total width in characters
         """
+        self.flush()
         if self.quiet:
             return
 
@@ -71,6 +97,7 @@ class ConversionReporter:
             multipass_count: Number of multipass shaders found
             single_count: Number of single-pass shaders found
         """
+        self.flush()
         if self.quiet:
             return
 
@@ -87,6 +114,7 @@ class ConversionReporter:
             selected: List of selected files/ISFInfo objects
             selection_strategy: Description of selection strategy
         """
+        self.flush()
         if self.quiet:
             return
 
@@ -131,7 +159,7 @@ class ConversionReporter:
             tag = "[MULTIPASS]" if file_info.is_multipass else "[SINGLE]"
             tag += f" ({file_info.num_passes} pass{'es' if file_info.num_passes > 1 else ''})"
 
-        print(f"\n[{current}/{total}] {tag} {filename}")
+        self._write_progress(f"\n[{current}/{total}] {tag} {filename}")
 
     def report_file_success(self, output_path: Path, file_size: int = None):
         """
@@ -144,11 +172,15 @@ class ConversionReporter:
         if self.quiet:
             return
 
-        if file_size is None and output_path.exists():
-            file_size = output_path.stat().st_size
+        if file_size is None:
+            # One stat rather than exists() followed by stat()
+            try:
+                file_size = output_path.stat().st_size
+            except OSError:
+                pass
 
         size_str = f" ({file_size:,} bytes)" if file_size else ""
-        print(f"   ✓ Created {output_path.name}{size_str}")
+        self._write_progress(f"   ✓ Created {output_path.name}{size_str}")
 
     def report_file_error(self, error_msg: str):
         """
@@ -157,6 +189,7 @@ class ConversionReporter:
         Args:
             error_msg: Error message
         """
+        self.flush()
         # Always show errors, even in quiet mode
         truncated = error_msg[:200] + "..." if len(error_msg) > 200 else error_msg
         print(f"   ✗ Error: {truncated}", file=sys.stderr)
@@ -169,7 +202,7 @@ class ConversionReporter:
             reason: Reason for skipping
         """
         if not self.quiet:
-            print(f"   ⊘ Skipped: {reason}")
+            self._write_progress(f"   ⊘ Skipped: {reason}")
 
     def print_summary(self, result: ConversionResult, stats: dict = None):
         """
@@ -221,6 +254,7 @@ class ConversionReporter:
         Args:
             message: Message to print
         """
+        self.flush()
         if not self.quiet:
             print(message)
 
@@ -231,6 +265,7 @@ class ConversionReporter:
         Args:
             message: Warning message
         """
+        self.flush()
         print(f"⚠️  {message}", file=sys.stderr)
 
     def print_error(self, message: str):
@@ -240,4 +275,5 @@ class ConversionReporter:
         Args:
             message: Error message
         """
+        self.flush()
         print(f"❌ {message}", file=sys.stderr)
@@ -1,7 +1,5 @@
 """Pytest configuration and fixtures for klproj tests."""
 
-import tempfile
-
 import pytest
 
 from klproj import (
@@ -14,16 +12,10 @@ from klproj import (
     ShaderSource,
     ShaderStage,
     ShaderStageType,
+    create_shadertoy_params,
 )
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
-
-
 @pytest.fixture
 def simple_vertex_shader():
     """Provide a simple GLSL vertex shader."""
@@ -146,6 +138,12 @@ def basic_mvp_param():
     )
 
 
+@pytest.fixture
+def shadertoy_params():
+    """Provide the Shadertoy parameter set."""
+    return create_shadertoy_params()
+
+
 @pytest.fixture
 def simple_vertex_stage(simple_vertex_shader, basic_mvp_param):
     """Provide a simple vertex shader stage."""
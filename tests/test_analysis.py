@@ -0,0 +1,224 @@
+"""Tests for klproj.utils.analysis module."""
+
+import xml.etree.ElementTree as StdET
+import zlib
+
+import pytest
+
+from klproj import (
+    KodeProjBuilder,
+    PassType,
+    RenderPass,
+    ShaderProfile,
+    ShaderSource,
+    ShaderStage,
+    ShaderStageType,
+    create_mvp_param,
+    create_resolution_param,
+    create_time_param,
+)
+from klproj.utils import analysis
+from klproj.utils.analysis import AnalysisIssue, KlprojAnalyzer
+
+CHECKS = ["structure", "uniforms", "undefined_vars"]
+
+VERTEX_CODE = """#version 150
+in vec4 a_position;
+uniform mat4 mvp;
+void main() { gl_Position = mvp * a_position; }
+"""
+
+# Exercises the declaration patterns: a precision qualifier, a const, and a
+# commented-out declaration (which counts as declared), plus an identifier
+# that only appears in a comment
+FRAGMENT_CODE = """#version 150
+out vec4 fragColor;
+uniform highp float time;
+uniform vec2 resolution;
+const float SCALE = 2.0;
+// uniform float offset;
+/* scaled by gain */
+void main() {
+    vec2 uv = gl_FragCoord.xy / resolution * SCALE * speed;
+    fragColor = vec4(uv, sin(time + offset), 1.0);
+}
+"""
+
+EXPECTED_ISSUES = [
+    AnalysisIssue("warning", "structure", "Missing expected parameter: TIME"),
+    AnalysisIssue("warning", "structure", "Missing expected parameter: RENDERSIZE"),
+    AnalysisIssue(
+        "warning",
+        "uniforms",
+        "Parameter 'speed' used but no uniform declaration found",
+        pass_index=0,
+        details={"parameter": "speed"},
+    ),
+] + [
+    AnalysisIssue(
+        "warning",
+        "undefined_vars",
+        f"Potentially undefined variable: {name}",
+        pass_index=0,
+        details={"variable": name},
+    )
+    for name in ["highp", "uv", "version"]
+]
+
+# Padding that pushes a project's XML over the incremental parse threshold
+LARGE_PADDING = analysis._STREAM_PARSE_THRESHOLD + 1024
+
+
+def _save_project(path, padding=0):
+    """
+    Save a one-pass project whose vertex shader is padded with a comment.
+
+    The padding sits in a stage no check reads, so it changes only the
+    document size, not the expected issues.
+    """
+    builder = KodeProjBuilder(api="GL3")
+    builder.add_global_param(create_time_param())
+    builder.add_global_param(create_resolution_param())
+    builder.add_global_param(create_time_param("speed"))
+
+    vertex_code = VERTEX_CODE + "// " + "x" * padding + "\n" if padding else VERTEX_CODE
+    vertex_stage = ShaderStage(
+        stage_type=ShaderStageType.VERTEX,
+        sources=[ShaderSource(ShaderProfile.GL3, vertex_code)],
+        parameters=[create_mvp_param()],
+    )
+    fragment_stage = ShaderStage(
+        stage_type=ShaderStageType.FRAGMENT,
+        sources=[ShaderSource(ShaderProfile.GL3, FRAGMENT_CODE)],
+    )
+    builder.add_pass(
+        RenderPass(pass_type=PassType.RENDER, label="Main", stages=[vertex_stage, fragment_stage])
+    )
+    builder.save(path)
+    return path
+
+
+def _reference_issues(analyzer, xml_data):
+    """Run each check serially on a fully parsed, unpruned in-memory tree."""
+    root = analysis.ET.fromstring(xml_data)
+    issues = []
+    issues.extend(analyzer.check_structure(root).issues)
+    issues.extend(analyzer.check_uniforms(root).issues)
+    issues.extend(analyzer.check_undefined_vars(root).issues)
+    return issues
+
+
+@pytest.fixture(params=[0, LARGE_PADDING], ids=["small", "large"])
+def project(request, tmp_path):
+    """Provide a saved project below or above the incremental parse threshold."""
+    return _save_project(tmp_path / "project.klproj", padding=request.param)
+
+
+class TestKlprojAnalyzer:
+    """Test analyzing single projects."""
+
+    def test_analyze_file(self, project):
+        """Test that analyze_file() matches the serial in-memory checks."""
+        analyzer = KlprojAnalyzer()
+        result = analyzer.analyze_file(project, CHECKS)
+
+        assert result.issues == EXPECTED_ISSUES
+        assert result.issues == _reference_issues(analyzer, zlib.decompress(project.read_bytes()))
+        assert result.warning_count == len(EXPECTED_ISSUES)
+        assert not result.has_errors
+
+    @pytest.mark.parametrize("source", ["bytes", "path", "element"])
+    def test_sources_agree(self, project, tmp_path, source):
+        """Test that XML bytes, an XML file and a parsed root give the same issues."""
+        analyzer = KlprojAnalyzer()
+        xml_data = zlib.decompress(project.read_bytes())
+        if source == "path":
+            xml = tmp_path / "project.xml"
+            xml.write_bytes(xml_data)
+        elif source == "element":
+            xml = analyzer._parse_root(xml_data)
+        else:
+            xml = xml_data
+
+        issues = []
+        issues.extend(analyzer.check_structure(xml).issues)
+        issues.extend(analyzer.check_uniforms(xml).issues)
+        issues.extend(analyzer.check_undefined_vars(xml).issues)
+
+        assert issues == _reference_issues(analyzer, xml_data)
+
+    def test_large_document_is_pruned(self, tmp_path):
+        """Test that large documents drop the stages no check reads."""
+        path = _save_project(tmp_path / "large.klproj", padding=LARGE_PADDING)
+        root = KlprojAnalyzer()._parse_root(zlib.decompress(path.read_bytes()))
+
+        pass_elem = root.find("document/passes/pass")
+        fragment_stage = pass_elem.find(analysis._FRAGMENT_STAGE_PATH)
+        vertex_stage = next(
+            s for s in pass_elem.iterfind("stages/stage") if s is not fragment_stage
+        )
+
+        assert len(vertex_stage) == 0
+        assert fragment_stage.find("shader/source").text == FRAGMENT_CODE
+
+    def test_element_tree_fallback(self, project, monkeypatch):
+        """Test that the stdlib ElementTree backend gives the same issues as the default."""
+        expected = KlprojAnalyzer().analyze_file(project, CHECKS).issues
+
+        monkeypatch.setattr(analysis, "ET", StdET)
+        monkeypatch.setattr(analysis, "_Element", StdET.Element)
+
+        assert KlprojAnalyzer().analyze_file(project, CHECKS).issues == expected
+
+    def test_glsl_keywords_are_per_instance(self, tmp_path):
+        """Test that editing glsl_keywords affects only that analyzer."""
+        path = _save_project(tmp_path / "project.klproj")
+        custom = KlprojAnalyzer()
+        custom.glsl_keywords.add("uv")
+
+        custom_issues = custom.analyze_file(path, ["undefined_vars"]).issues
+        default_issues = KlprojAnalyzer().analyze_file(path, ["undefined_vars"]).issues
+
+        assert [i.details["variable"] for i in custom_issues] == ["highp", "version"]
+        assert [i.details["variable"] for i in default_issues] == ["highp", "uv", "version"]
+
+    def test_unreadable_file(self, tmp_path):
+        """Test that a file that is not zlib data is reported as an extraction error."""
+        path = tmp_path / "broken.klproj"
+        path.write_bytes(b"not a klproj")
+
+        result = KlprojAnalyzer().analyze_file(path, CHECKS)
+
+        assert [(i.severity, i.category) for i in result.issues] == [("error", "extraction")]
+
+
+class TestAnalyzeBatch:
+    """Test analyzing batches of projects."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        """Provide a small project, a large project and an unreadable file."""
+        broken = tmp_path / "broken.klproj"
+        broken.write_bytes(b"not a klproj")
+        return [
+            _save_project(tmp_path / "small.klproj"),
+            _save_project(tmp_path / "large.klproj", padding=LARGE_PADDING),
+            broken,
+        ]
+
+    def test_parallel_matches_serial(self, files):
+        """Test that a multi-worker batch matches a serial one, in input order."""
+        analyzer = KlprojAnalyzer()
+        calls = []
+
+        serial = analyzer.analyze_batch(files, CHECKS)
+        parallel = analyzer.analyze_batch(
+            files, CHECKS, reporter=lambda *args: calls.append(args), max_workers=2
+        )
+
+        assert calls == [(1, 3, "small.klproj"), (2, 3, "large.klproj"), (3, 3, "broken.klproj")]
+        assert list(parallel.file_results) == [f.name for f in files]
+        for name, result in serial.file_results.items():
+            assert parallel.file_results[name].issues == result.issues
+        assert parallel.file_results["small.klproj"].issues == EXPECTED_ISSUES
+        assert parallel.file_results["large.klproj"].issues == EXPECTED_ISSUES
@@ -0,0 +1,109 @@
+"""Tests for klproj.utils.batch_processor module."""
+
+import zlib
+
+import pytest
+
+from klproj.utils.batch_processor import BatchConverter
+
+SHADER_TEMPLATE = """/*
+{
+  "DESCRIPTION": "%s",
+  "INPUTS": [{"NAME": "speed", "TYPE": "float", "DEFAULT": 1.0}]
+}
+*/
+
+void main() {
+    gl_FragColor = vec4(speed);
+}
+"""
+
+ALREADY_EXISTS = "Output file already exists (use --overwrite to replace)"
+
+
+@pytest.fixture
+def shader_files(tmp_path):
+    """
+    Provide a batch of ISF paths in a fixed order.
+
+    "a b.fs" and "a_b.fs" both map to a_b.klproj, "broken.fs" has no ISF
+    header and "missing.fs" does not exist.
+    """
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    names = ["glow.fs", "a b.fs", "broken.fs", "a_b.fs", "missing.fs", "wave.fs"]
+    for name in names:
+        if name == "broken.fs":
+            (src_dir / name).write_text("void main() {}\n")
+        elif name != "missing.fs":
+            (src_dir / name).write_text(SHADER_TEMPLATE % name)
+    return [src_dir / name for name in names]
+
+
+def _convert(files, output_dir, **kwargs):
+    """Convert files, returning the result, reporter calls and written files."""
+    calls = []
+    converter = BatchConverter(str(output_dir), **kwargs)
+    result = converter.convert_batch(files, reporter=lambda *args: calls.append(args[:3]))
+    written = {path.name: path.read_bytes() for path in output_dir.iterdir()}
+    return result, calls, written
+
+
+class TestBatchConverter:
+    """Test converting batches of ISF files."""
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing input is reported as not found."""
+        missing = tmp_path / "missing.fs"
+        converter = BatchConverter(str(tmp_path / "out"))
+
+        assert converter.convert_file(missing) == (False, None, f"File not found: {missing}")
+
+        result = converter.convert_batch([missing])
+        assert result.failed == [(missing, f"File not found: {missing}")]
+
+    def test_existing_output_is_not_overwritten(self, tmp_path, shader_files):
+        """Test that an existing output file is refused unless overwrite is set."""
+        glow = shader_files[0]
+        output_path = tmp_path / "out" / "glow.klproj"
+        output_path.parent.mkdir()
+        output_path.write_bytes(b"existing")
+
+        converter = BatchConverter(str(output_path.parent))
+        assert converter.convert_file(glow) == (False, None, ALREADY_EXISTS)
+        assert output_path.read_bytes() == b"existing"
+
+        converter = BatchConverter(str(output_path.parent), overwrite=True)
+        assert converter.convert_file(glow) == (True, output_path, None)
+        assert output_path.read_bytes() != b"existing"
+
+    @pytest.mark.parametrize("overwrite", [False, True], ids=["keep", "overwrite"])
+    def test_parallel_matches_serial(self, tmp_path, shader_files, overwrite):
+        """Test that a multi-worker batch converts like a serial one, in input order."""
+        serial, serial_calls, serial_files = _convert(
+            shader_files, tmp_path / "serial", overwrite=overwrite
+        )
+        parallel, parallel_calls, parallel_files = _convert(
+            shader_files, tmp_path / "parallel", overwrite=overwrite, max_workers=2
+        )
+
+        assert parallel_calls == serial_calls
+        assert [c[:2] for c in parallel_calls] == [(i, 6) for i in range(1, 7)]
+        assert [p.name for p in parallel.successful] == [p.name for p in serial.successful]
+        assert parallel.failed == serial.failed
+        assert parallel_files == serial_files
+
+        # The second file named a_b replaces the first only when overwriting
+        expected = ["glow.klproj", "a_b.klproj", "wave.klproj"]
+        if overwrite:
+            expected.insert(2, "a_b.klproj")
+        assert [p.name for p in parallel.successful] == expected
+        source = "a_b.fs" if overwrite else "a b.fs"
+        assert source.encode() in zlib.decompress(parallel_files["a_b.klproj"])
+
+        failed = {path.name: error for path, error in parallel.failed}
+        assert failed["missing.fs"] == f"File not found: {shader_files[4]}"
+        if overwrite:
+            assert "a_b.fs" not in failed
+        else:
+            assert failed["a_b.fs"] == ALREADY_EXISTS
@@ -1,9 +1,10 @@
 """Tests for klproj.generator module."""
 
-import os
-import tempfile
 import xml.etree.ElementTree as ET
 import zlib
+from collections import Counter
+
+import pytest
 
 from klproj.generator import KodeProjBuilder
 from klproj.types import (
@@ -38,11 +39,10 @@ class TestKodeProjBuilderInit:
         assert builder.version == 20
         assert builder.api == "GL3"
 
-    def test_different_apis(self):
+    @pytest.mark.parametrize("api", ["GL3", "GL2", "MTL", "ES3"])
+    def test_different_apis(self, api):
         """Test builder with different API values."""
-        for api in ["GL3", "GL2", "MTL", "ES3"]:
-            builder = KodeProjBuilder(api=api)
-            assert builder.api == api
+        assert KodeProjBuilder(api=api).api == api
 
 
 class TestKodeProjBuilderProperties:
@@ -133,93 +133,75 @@ class TestKodeProjBuilderPasses:
         assert builder.passes[1].label == "Pass 2"
 
 
+@pytest.fixture(scope="class")
+def default_xml_root():
+    """Parsed XML of a builder with default settings."""
+    return ET.fromstring(KodeProjBuilder().build_xml())
+
+
+@pytest.fixture(scope="class")
+def configured_xml_root():
+    """Parsed XML of a builder with properties and global params set."""
+    builder = KodeProjBuilder()
+    builder.set_resolution(1920, 1080)
+    builder.set_author("Test Author")
+    builder.add_global_param(
+        Parameter(
+            param_type=ParamType.CLOCK,
+            display_name="Test Time",
+            variable_name="testTime",
+            properties={"running": 1, "speed": 2.0},
+        )
+    )
+    builder.add_global_param(
+        Parameter(
+            param_type=ParamType.CONSTANT_FLOAT4,
+            display_name="Color",
+            variable_name="color",
+            properties={"value": Vec4(1.0, 0.5, 0.25, 1.0)},
+        )
+    )
+    return ET.fromstring(builder.build_xml())
+
+
 class TestKodeProjBuilderXML:
     """Test XML generation from KodeProjBuilder."""
 
-    def test_build_xml_structure(self):
+    def test_build_xml_structure(self, default_xml_root):
         """Test that build_xml produces valid XML."""
-        builder = KodeProjBuilder()
-        xml_str = builder.build_xml()
-
-        # Parse to verify it's valid XML
-        root = ET.fromstring(xml_str)
-        assert root.tag == "klxml"
-        assert root.get("v") == "19"
-        assert root.get("a") == "MTL"
+        assert default_xml_root.tag == "klxml"
+        assert default_xml_root.get("v") == "19"
+        assert default_xml_root.get("a") == "MTL"
 
-    def test_xml_has_document(self):
+    def test_xml_has_document(self, default_xml_root):
         """Test that XML contains document element."""
-        builder = KodeProjBuilder()
-        xml_str = builder.build_xml()
-        root = ET.fromstring(xml_str)
-
-        document = root.find("document")
-        assert document is not None
+        assert default_xml_root.find("document") is not None
 
-    def test_xml_has_properties(self):
+    def test_xml_has_properties(self, configured_xml_root):
         """Test that XML contains properties section."""
-        builder = KodeProjBuilder()
-        builder.set_resolution(1920, 1080)
-        builder.set_author("Test Author")
-
-        xml_str = builder.build_xml()
-        root = ET.fromstring(xml_str)
-
-        properties = root.find(".//properties")
+        properties = configured_xml_root.find(".//properties")
         assert properties is not None
 
         author = properties.find("author")
         assert author is not None
         assert author.text == "Test Author"
 
-    def test_xml_has_params_section(self):
+    def test_xml_has_params_section(self, configured_xml_root):
         """Test that XML contains params section."""
-        builder = KodeProjBuilder()
-        param = Parameter(ParamType.CLOCK, "Time", "time")
-        builder.add_global_param(param)
-
-        xml_str = builder.build_xml()
-        root = ET.fromstring(xml_str)
+        assert configured_xml_root.find(".//params") is not None
 
-        params = root.find(".//params")
-        assert params is not None
-
-    def test_xml_parameter_encoding(self):
+    def test_xml_parameter_encoding(self, configured_xml_root):
         """Test that parameters are properly encoded in XML."""
-        builder = KodeProjBuilder()
-        param = Parameter(
-            param_type=ParamType.CLOCK,
-            display_name="Test Time",
-            variable_name="testTime",
-            properties={"running": 1, "speed": 2.0},
-        )
-        builder.add_global_param(param)
-
-        xml_str = builder.build_xml()
-        root = ET.fromstring(xml_str)
-
-        param_elem = root.find(".//param[@type='CLOCK']")
+        param_elem = configured_xml_root.find(".//param[@type='CLOCK']")
         assert param_elem is not None
         assert param_elem.find("displayName").text == "Test Time"
         assert param_elem.find("variableName").text == "testTime"
         assert param_elem.find("running").text == "1"
         assert param_elem.find("speed").text == "2.0"
 
-    def test_xml_vector_encoding(self):
+    def test_xml_vector_encoding(self, configured_xml_root):
         """Test that vector properties are properly encoded."""
-        builder = KodeProjBuilder()
-        param = Parameter(
-            param_type=ParamType.CONSTANT_FLOAT4,
-            display_name="Color",
-            variable_name="color",
-            properties={"value": Vec4(1.0, 0.5, 0.25, 1.0)},
-        )
-        builder.add_global_param(param)
-
-        xml_str = builder.build_xml()
-        root = ET.fromstring(xml_str)
-
-        param_elem = root.find(".//param[@type='CONSTANT_FLOAT4']")
+        param_elem = configured_xml_root.find(".//param[@type='CONSTANT_FLOAT4']")
         assert param_elem is not None
 
         value = param_elem.find("value")
@@ -277,36 +259,33 @@ class TestKodeProjBuilderXML:
 class TestKodeProjBuilderSave:
     """Test saving .klproj files."""
 
-    def test_save_creates_file(self):
+    def test_save_creates_file(self, tmp_path):
         """Test that save creates a file."""
         builder = KodeProjBuilder()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "test.klproj")
-            builder.save(filepath)
-            assert os.path.exists(filepath)
+        filepath = tmp_path / "test.klproj"
+        builder.save(filepath)
+        assert filepath.exists()
 
-    def test_save_creates_compressed_file(self):
+    def test_save_creates_compressed_file(self, tmp_path):
         """Test that saved file is compressed."""
         builder = KodeProjBuilder()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "test.klproj")
-            builder.save(filepath)
+        filepath = tmp_path / "test.klproj"
+        builder.save(filepath)
 
-            # Read the file and verify it's compressed
-            with open(filepath, "rb") as f:
-                compressed_data = f.read()
+        # Read the file and verify it's compressed
+        compressed_data = filepath.read_bytes()
 
-            # Should be able to decompress it
-            decompressed = zlib.decompress(compressed_data)
-            assert len(decompressed) > 0
+        # Should be able to decompress it
+        decompressed = zlib.decompress(compressed_data)
+        assert len(decompressed) > 0
 
-            # Decompressed data should be valid XML
-            root = ET.fromstring(decompressed)
-            assert root.tag == "klxml"
+        # Decompressed data should be valid XML
+        root = ET.fromstring(decompressed)
+        assert root.tag == "klxml"
 
-    def test_save_preserves_data(self):
+    def test_save_preserves_data(self, tmp_path):
         """Test that saved file contains correct data."""
         builder = KodeProjBuilder()
         builder.set_resolution(1280, 720)
@@ -315,57 +294,53 @@ class TestKodeProjBuilderSave:
         param = Parameter(ParamType.CLOCK, "Time", "time")
         builder.add_global_param(param)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "test.klproj")
-            builder.save(filepath)
-
-            # Read and decompress
-            with open(filepath, "rb") as f:
-                compressed = f.read()
-            decompressed = zlib.decompress(compressed)
-            root = ET.fromstring(decompressed)
-
-            # Verify data
-            author = root.find(".//author")
-            assert author.text == "Test Author"
-
-            size_x = root.find(".//properties/size/x")
-            assert size_x.text == "1280"
+        filepath = tmp_path / "test.klproj"
+        builder.save(filepath)
 
+        # Read and decompress
+        compressed = filepath.read_bytes()
+        decompressed = zlib.decompress(compressed)
+        root = ET.fromstring(decompressed)
 
-class TestKodeProjBuilderIntegration:
-    """Integration tests for complete project generation."""
-
-    def test_complete_shader_project(self):
-        """Test creating a complete shader project."""
-        builder = KodeProjBuilder(api="GL3")
-        builder.set_resolution(1920, 1080)
-        builder.set_author("Test")
-
-        # Add global parameters
-        time_param = Parameter(
-            param_type=ParamType.CLOCK,
-            display_name="Time",
-            variable_name="time",
-            properties={"running": 1, "speed": 1.0},
-        )
-        resolution_param = Parameter(
-            param_type=ParamType.FRAME_RESOLUTION,
-            display_name="Resolution",
-            variable_name="resolution",
-        )
-        builder.add_global_param(time_param)
-        builder.add_global_param(resolution_param)
+        # Verify data
+        author = root.find(".//author")
+        assert author.text == "Test Author"
 
-        # Create shader stages
-        vertex_code = """#version 150
+        size_x = root.find(".//properties/size/x")
+        assert size_x.text == "1280"
+
+
+@pytest.fixture(scope="class")
+def complete_project(tmp_path_factory):
+    """Save a complete shader project once; return its path and parsed root."""
+    builder = KodeProjBuilder(api="GL3")
+    builder.set_resolution(1920, 1080)
+    builder.set_author("Test")
+
+    # Add global parameters
+    time_param = Parameter(
+        param_type=ParamType.CLOCK,
+        display_name="Time",
+        variable_name="time",
+        properties={"running": 1, "speed": 1.0},
+    )
+    resolution_param = Parameter(
+        param_type=ParamType.FRAME_RESOLUTION,
+        display_name="Resolution",
+        variable_name="resolution",
+    )
+    builder.add_global_param(time_param)
+    builder.add_global_param(resolution_param)
+
+    # Create shader stages
+    vertex_code = """#version 150
 in vec4 a_position;
 uniform mat4 mvp;
 void main() {
     gl_Position = mvp * a_position;
 }"""
 
-        fragment_code = """#version 150
+    fragment_code = """#version 150
 out vec4 fragColor;
 uniform float time;
 uniform vec2 resolution;
@@ -374,56 +349,59 @@ void main() {
     fragColor = vec4(uv, 0.5 + 0.5 * sin(time), 1.0);
 }"""
 
-        mvp_param = Parameter(
-            param_type=ParamType.TRANSFORM_MVP,
-            display_name="MVP",
-            variable_name="mvp",
-        )
+    mvp_param = Parameter(
+        param_type=ParamType.TRANSFORM_MVP,
+        display_name="MVP",
+        variable_name="mvp",
+    )
+
+    vertex_stage = ShaderStage(
+        stage_type=ShaderStageType.VERTEX,
+        enabled=1,
+        hidden=1,
+        sources=[ShaderSource(ShaderProfile.GL3, vertex_code)],
+        parameters=[mvp_param],
+    )
+
+    fragment_stage = ShaderStage(
+        stage_type=ShaderStageType.FRAGMENT,
+        enabled=1,
+        sources=[ShaderSource(ShaderProfile.GL3, fragment_code)],
+    )
+
+    # Create render pass
+    render_pass = RenderPass(
+        pass_type=PassType.RENDER,
+        label="Main Pass",
+        stages=[vertex_stage, fragment_stage],
+        width=1920,
+        height=1080,
+    )
+
+    builder.add_pass(render_pass)
+
+    filepath = tmp_path_factory.mktemp("complete") / "complete.klproj"
+    builder.save(filepath)
+    return filepath, ET.fromstring(zlib.decompress(filepath.read_bytes()))
 
-        vertex_stage = ShaderStage(
-            stage_type=ShaderStageType.VERTEX,
-            enabled=1,
-            hidden=1,
-            sources=[ShaderSource(ShaderProfile.GL3, vertex_code)],
-            parameters=[mvp_param],
-        )
 
-        fragment_stage = ShaderStage(
-            stage_type=ShaderStageType.FRAGMENT,
-            enabled=1,
-            sources=[ShaderSource(ShaderProfile.GL3, fragment_code)],
-        )
-
-        # Create render pass
-        render_pass = RenderPass(
-            pass_type=PassType.RENDER,
-            label="Main Pass",
-            stages=[vertex_stage, fragment_stage],
-            width=1920,
-            height=1080,
-        )
-
-        builder.add_pass(render_pass)
+class TestKodeProjBuilderIntegration:
+    """Integration tests for complete project generation."""
 
-        # Save and verify
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "complete.klproj")
-            builder.save(filepath)
-
-            # Verify file exists and is valid
-            assert os.path.exists(filepath)
-
-            with open(filepath, "rb") as f:
-                compressed = f.read()
-            decompressed = zlib.decompress(compressed)
-            root = ET.fromstring(decompressed)
-
-            # Verify structure
-            assert root.tag == "klxml"
-            assert root.get("a") == "GL3"
-            assert len(root.findall(".//param")) == 3  # time, resolution, mvp
-            assert len(root.findall(".//pass")) == 1
-            assert len(root.findall(".//stage")) == 2
+    def test_complete_shader_project(self, complete_project):
+        """Test creating a complete shader project."""
+        filepath, root = complete_project
+        assert filepath.exists()
+        assert root.tag == "klxml"
+        assert root.get("a") == "GL3"
+
+    def test_complete_shader_project_elements(self, complete_project):
+        """Test element counts in a complete shader project."""
+        _, root = complete_project
+        counts = Counter(elem.tag for elem in root.iter())
+        assert counts["param"] == 3  # time, resolution, mvp
+        assert counts["pass"] == 1
+        assert counts["stage"] == 2
 
     def test_multi_pass_project(self):
         """Test creating a multi-pass project."""
@@ -1,5 +1,7 @@
 """Tests for klproj.helpers module."""
 
+import pytest
+
 from klproj.helpers import (
     create_default_vertex_stage,
     create_file_watch_stage,
@@ -13,6 +15,10 @@ from klproj.helpers import (
 )
 from klproj.types import Parameter, ParamType, ShaderProfile, ShaderStage, ShaderStageType
 
+# Watched shader paths for the file-watch stage tests
+FRAGMENT_PATH = "/path/to/shader.fs"
+VERTEX_PATH = "/path/to/shader.vs"
+
 
 class TestCreateShadertoyParams:
     """Test create_shadertoy_params function."""
@@ -23,89 +29,66 @@ class TestCreateShadertoyParams:
         assert isinstance(params, list)
         assert len(params) > 0
 
-    def test_returns_seven_parameters(self):
+    def test_returns_seven_parameters(self, shadertoy_params):
         """Test that it returns exactly 7 parameters."""
-        params = create_shadertoy_params()
-        assert len(params) == 7
+        assert len(shadertoy_params) == 7
 
-    def test_all_are_parameters(self):
+    def test_all_are_parameters(self, shadertoy_params):
         """Test that all items are Parameter objects."""
-        params = create_shadertoy_params()
-        for param in params:
+        for param in shadertoy_params:
             assert isinstance(param, Parameter)
 
-    def test_iresolution_parameter(self):
-        """Test iResolution parameter."""
-        params = create_shadertoy_params()
-        iresolution = params[0]
-
-        assert iresolution.param_type == ParamType.FRAME_RESOLUTION
-        assert iresolution.display_name == "Frame Resolution"
-        assert iresolution.variable_name == "iResolution"
-
-    def test_itime_parameter(self):
-        """Test iTime parameter."""
-        params = create_shadertoy_params()
-        itime = params[1]
-
-        assert itime.param_type == ParamType.CLOCK
-        assert itime.display_name == "Clock"
-        assert itime.variable_name == "iTime"
-        assert itime.properties["running"] == 1
-        assert itime.properties["speed"] == 1
-
-    def test_itimedelta_parameter(self):
-        """Test iTimeDelta parameter."""
-        params = create_shadertoy_params()
-        itimedelta = params[2]
-
-        assert itimedelta.param_type == ParamType.FRAME_DELTA
-        assert itimedelta.display_name == "Frame Delta"
-        assert itimedelta.variable_name == "iTimeDelta"
-
-    def test_iframe_parameter(self):
-        """Test iFrame parameter."""
-        params = create_shadertoy_params()
-        iframe = params[3]
-
-        assert iframe.param_type == ParamType.FRAME_NUMBER
-        assert iframe.display_name == "Frame Number"
-        assert iframe.variable_name == "iFrame"
-
-    def test_imouse_parameter(self):
-        """Test iMouse parameter."""
-        params = create_shadertoy_params()
-        imouse = params[4]
-
-        assert imouse.param_type == ParamType.INPUT_MOUSE_SIMPLE
-        assert imouse.display_name == "Mouse Simple"
-        assert imouse.variable_name == "iMouse"
-        assert imouse.properties["variant"] == 1
-        assert imouse.properties["normalize"] == 0
-        assert imouse.properties["invert"]["x"] == 0
-        assert imouse.properties["invert"]["y"] == 1
-
-    def test_idate_parameter(self):
-        """Test iDate parameter."""
-        params = create_shadertoy_params()
-        idate = params[5]
-
-        assert idate.param_type == ParamType.DATE
-        assert idate.display_name == "Date"
-        assert idate.variable_name == "iDate"
-
-    def test_isamplerate_parameter(self):
-        """Test iSampleRate parameter."""
-        params = create_shadertoy_params()
-        isamplerate = params[6]
-
-        assert isamplerate.param_type == ParamType.AUDIO_SAMPLE_RATE
-        assert isamplerate.display_name == "Audio Sample Rate"
-        assert isamplerate.variable_name == "iSampleRate"
-
-    def test_parameters_order(self):
+    @pytest.mark.parametrize(
+        "index,param_type,display_name,variable_name,properties",
+        [
+            pytest.param(
+                0,
+                ParamType.FRAME_RESOLUTION,
+                "Frame Resolution",
+                "iResolution",
+                {},
+                id="iResolution",
+            ),
+            pytest.param(
+                1, ParamType.CLOCK, "Clock", "iTime", {"running": 1, "speed": 1}, id="iTime"
+            ),
+            pytest.param(
+                2, ParamType.FRAME_DELTA, "Frame Delta", "iTimeDelta", {}, id="iTimeDelta"
+            ),
+            pytest.param(3, ParamType.FRAME_NUMBER, "Frame Number", "iFrame", {}, id="iFrame"),
+            pytest.param(
+                4,
+                ParamType.INPUT_MOUSE_SIMPLE,
+                "Mouse Simple",
+                "iMouse",
+                {"variant": 1, "normalize": 0, "invert": {"x": 0, "y": 1}},
+                id="iMouse",
+            ),
+            pytest.param(5, ParamType.DATE, "Date", "iDate", {}, id="iDate"),
+            pytest.param(
+                6,
+                ParamType.AUDIO_SAMPLE_RATE,
+                "Audio Sample Rate",
+                "iSampleRate",
+                {},
+                id="iSampleRate",
+            ),
+        ],
+    )
+    def test_shadertoy_parameter(
+        self, shadertoy_params, index, param_type, display_name, variable_name, properties
+    ):
+        """Test each Shadertoy parameter's type, names and key properties."""
+        param = shadertoy_params[index]
+
+        assert param.param_type == param_type
+        assert param.display_name == display_name
+        assert param.variable_name == variable_name
+        for key, value in properties.items():
+            assert param.properties[key] == value
+
+    def test_parameters_order(self, shadertoy_params):
         """Test that parameters are in the correct order."""
-        params = create_shadertoy_params()
         expected_names = [
             "iResolution",
             "iTime",
@@ -115,7 +98,7 @@ class TestCreateShadertoyParams:
             "iDate",
             "iSampleRate",
         ]
-        actual_names = [p.variable_name for p in params]
+        actual_names = [p.variable_name for p in shadertoy_params]
         assert actual_names == expected_names
 
 
@@ -148,6 +131,12 @@ class TestCreateMvpParam:
         assert param.properties == {}
 
 
+@pytest.fixture
+def default_time_param():
+    """Provide a time parameter with default arguments."""
+    return create_time_param()
+
+
 class TestCreateTimeParam:
     """Test create_time_param function."""
 
@@ -156,52 +145,42 @@ class TestCreateTimeParam:
         param = create_time_param()
         assert isinstance(param, Parameter)
 
-    def test_default_variable_name(self):
+    def test_default_variable_name(self, default_time_param):
         """Test default variable name."""
-        param = create_time_param()
-        assert param.variable_name == "time"
+        assert default_time_param.variable_name == "time"
 
     def test_custom_variable_name(self):
         """Test custom variable name."""
         param = create_time_param(variable_name="uTime")
         assert param.variable_name == "uTime"
 
-    def test_default_speed(self):
-        """Test default speed."""
-        param = create_time_param()
-        assert param.properties["speed"] == 1.0
-
     def test_custom_speed(self):
         """Test custom speed."""
         param = create_time_param(speed=2.5)
         assert param.properties["speed"] == 2.5
 
-    def test_param_type(self):
+    def test_param_type(self, default_time_param):
         """Test parameter type."""
-        param = create_time_param()
-        assert param.param_type == ParamType.CLOCK
+        assert default_time_param.param_type == ParamType.CLOCK
 
-    def test_display_name(self):
+    def test_display_name(self, default_time_param):
         """Test display name."""
-        param = create_time_param()
-        assert param.display_name == "Time"
-
-    def test_running_property(self):
-        """Test that running property is set."""
-        param = create_time_param()
-        assert param.properties["running"] == 1
-
-    def test_direction_property(self):
-        """Test that direction property is set."""
-        param = create_time_param()
-        assert param.properties["direction"] == 1
-
-    def test_loop_properties(self):
-        """Test loop properties."""
-        param = create_time_param()
-        assert param.properties["loop"] == 0
-        assert param.properties["loopStart"] == 0
-        assert param.properties["loopEnd"] == 6.28319
+        assert default_time_param.display_name == "Time"
+
+    @pytest.mark.parametrize(
+        "key,expected",
+        [
+            ("speed", 1.0),
+            ("running", 1),
+            ("direction", 1),
+            ("loop", 0),
+            ("loopStart", 0),
+            ("loopEnd", 6.28319),
+        ],
+    )
+    def test_default_property(self, default_time_param, key, expected):
+        """Test each property of a default time parameter."""
+        assert default_time_param.properties[key] == expected
 
     def test_all_properties_with_custom_speed(self):
         """Test that custom speed doesn't affect other properties."""
@@ -381,69 +360,66 @@ class TestHelpersIntegration:
         assert time1.properties["speed"] != time2.properties["speed"]
 
 
+@pytest.fixture
+def generic_watch_stage():
+    """Provide a default fragment stage from create_file_watch_stage."""
+    return create_file_watch_stage(ShaderStageType.FRAGMENT, FRAGMENT_PATH, shader_code="")
+
+
+@pytest.fixture
+def vertex_watch_stage():
+    """Provide a default stage from create_vertex_file_watch_stage."""
+    return create_vertex_file_watch_stage(VERTEX_PATH, shader_code="")
+
+
+@pytest.fixture
+def fragment_watch_stage():
+    """Provide a default stage from create_fragment_file_watch_stage."""
+    return create_fragment_file_watch_stage(FRAGMENT_PATH, shader_code="")
+
+
 class TestCreateFileWatchStage:
     """Test create_file_watch_stage function."""
 
     def test_returns_shader_stage(self):
         """Test that function returns a ShaderStage."""
-        stage = create_file_watch_stage(
-            ShaderStageType.FRAGMENT, "/path/to/shader.fs", shader_code=""
-        )
+        stage = create_file_watch_stage(ShaderStageType.FRAGMENT, FRAGMENT_PATH, shader_code="")
         assert isinstance(stage, ShaderStage)
 
     def test_stage_type(self):
         """Test that stage type is set correctly."""
-        stage = create_file_watch_stage(
-            ShaderStageType.VERTEX, "/path/to/shader.vs", shader_code=""
-        )
+        stage = create_file_watch_stage(ShaderStageType.VERTEX, VERTEX_PATH, shader_code="")
         assert stage.stage_type == ShaderStageType.VERTEX
 
-    def test_file_watch_enabled(self):
+    def test_file_watch_enabled(self, generic_watch_stage):
         """Test that file watching is enabled."""
-        stage = create_file_watch_stage(
-            ShaderStageType.FRAGMENT, "/path/to/shader.fs", shader_code=""
-        )
-        assert stage.file_watch is True
+        assert generic_watch_stage.file_watch is True
 
-    def test_file_watch_path(self):
+    def test_file_watch_path(self, generic_watch_stage):
         """Test that file watch path is set correctly."""
-        path = "/path/to/shader.fs"
-        stage = create_file_watch_stage(ShaderStageType.FRAGMENT, path, shader_code="")
-        assert stage.file_watch_path == path
+        assert generic_watch_stage.file_watch_path == FRAGMENT_PATH
 
-    def test_sources_empty(self):
+    def test_sources_empty(self, generic_watch_stage):
         """Test that sources list is empty for file watching."""
-        stage = create_file_watch_stage(
-            ShaderStageType.FRAGMENT, "/path/to/shader.fs", shader_code=""
-        )
-        assert stage.sources == []
+        assert generic_watch_stage.sources == []
 
-    def test_enabled_by_default(self):
+    def test_enabled_by_default(self, generic_watch_stage):
         """Test that stage is enabled by default."""
-        stage = create_file_watch_stage(
-            ShaderStageType.FRAGMENT, "/path/to/shader.fs", shader_code=""
-        )
-        assert stage.enabled == 1
+        assert generic_watch_stage.enabled == 1
 
-    def test_not_hidden(self):
+    def test_not_hidden(self, generic_watch_stage):
         """Test that stage is not hidden by default."""
-        stage = create_file_watch_stage(
-            ShaderStageType.FRAGMENT, "/path/to/shader.fs", shader_code=""
-        )
-        assert stage.hidden == 0
+        assert generic_watch_stage.hidden == 0
 
-    def test_no_parameters_by_default(self):
+    def test_no_parameters_by_default(self, generic_watch_stage):
         """Test that no parameters are added by default."""
-        stage = create_file_watch_stage(
-            ShaderStageType.FRAGMENT, "/path/to/shader.fs", shader_code=""
-        )
-        assert stage.parameters == []
+        assert generic_watch_stage.parameters == []
 
     def test_custom_parameters(self):
         """Test that custom parameters can be added."""
         params = [create_mvp_param()]
         stage = create_file_watch_stage(
-            ShaderStageType.VERTEX, "/path/to/shader.vs", parameters=params, shader_code=""
+            ShaderStageType.VERTEX, VERTEX_PATH, parameters=params, shader_code=""
         )
         assert len(stage.parameters) == 1
         assert stage.parameters[0].param_type == ParamType.TRANSFORM_MVP
@@ -454,34 +430,29 @@ class TestCreateVertexFileWatchStage:
 
     def test_returns_shader_stage(self):
         """Test that function returns a ShaderStage."""
-        stage = create_vertex_file_watch_stage("/path/to/shader.vs", shader_code="")
+        stage = create_vertex_file_watch_stage(VERTEX_PATH, shader_code="")
         assert isinstance(stage, ShaderStage)
 
-    def test_stage_type_is_vertex(self):
+    def test_stage_type_is_vertex(self, vertex_watch_stage):
         """Test that stage type is VERTEX."""
-        stage = create_vertex_file_watch_stage("/path/to/shader.vs", shader_code="")
-        assert stage.stage_type == ShaderStageType.VERTEX
+        assert vertex_watch_stage.stage_type == ShaderStageType.VERTEX
 
-    def test_file_watch_enabled(self):
+    def test_file_watch_enabled(self, vertex_watch_stage):
         """Test that file watching is enabled."""
-        stage = create_vertex_file_watch_stage("/path/to/shader.vs", shader_code="")
-        assert stage.file_watch is True
+        assert vertex_watch_stage.file_watch is True
 
-    def test_file_watch_path(self):
+    def test_file_watch_path(self, vertex_watch_stage):
         """Test that file watch path is set correctly."""
-        path = "/path/to/shader.vs"
-        stage = create_vertex_file_watch_stage(path, shader_code="")
-        assert stage.file_watch_path == path
+        assert vertex_watch_stage.file_watch_path == VERTEX_PATH
 
-    def test_mvp_included_by_default(self):
+    def test_mvp_included_by_default(self, vertex_watch_stage):
         """Test that MVP parameter is included by default."""
-        stage = create_vertex_file_watch_stage("/path/to/shader.vs", shader_code="")
-        assert len(stage.parameters) == 1
-        assert stage.parameters[0].param_type == ParamType.TRANSFORM_MVP
+        assert len(vertex_watch_stage.parameters) == 1
+        assert vertex_watch_stage.parameters[0].param_type == ParamType.TRANSFORM_MVP
 
     def test_mvp_can_be_disabled(self):
         """Test that MVP parameter can be disabled."""
-        stage = create_vertex_file_watch_stage("/path/to/shader.vs", mvp=False, shader_code="")
+        stage = create_vertex_file_watch_stage(VERTEX_PATH, mvp=False, shader_code="")
         assert len(stage.parameters) == 0
 
 
@@ -490,40 +461,39 @@ class TestCreateFragmentFileWatchStage:
 
     def test_returns_shader_stage(self):
         """Test that function returns a ShaderStage."""
-        stage = create_fragment_file_watch_stage("/path/to/shader.fs", shader_code="")
+        stage = create_fragment_file_watch_stage(FRAGMENT_PATH, shader_code="")
         assert isinstance(stage, ShaderStage)
 
-    def test_stage_type_is_fragment(self):
+    def test_stage_type_is_fragment(self, fragment_watch_stage):
         """Test that stage type is FRAGMENT."""
-        stage = create_fragment_file_watch_stage("/path/to/shader.fs", shader_code="")
-        assert stage.stage_type == ShaderStageType.FRAGMENT
+        assert fragment_watch_stage.stage_type == ShaderStageType.FRAGMENT
 
-    def test_file_watch_enabled(self):
+    def test_file_watch_enabled(self, fragment_watch_stage):
         """Test that file watching is enabled."""
-        stage = create_fragment_file_watch_stage("/path/to/shader.fs", shader_code="")
-        assert stage.file_watch is True
+        assert fragment_watch_stage.file_watch is True
 
-    def test_file_watch_path(self):
+    def test_file_watch_path(self, fragment_watch_stage):
         """Test that file watch path is set correctly."""
-        path = "/path/to/shader.fs"
-        stage = create_fragment_file_watch_stage(path, shader_code="")
-        assert stage.file_watch_path == path
+        assert fragment_watch_stage.file_watch_path == FRAGMENT_PATH
 
-    def test_no_parameters_by_default(self):
+    def test_no_parameters_by_default(self, fragment_watch_stage):
         """Test that no parameters are added by default."""
-        stage = create_fragment_file_watch_stage("/path/to/shader.fs", shader_code="")
-        assert stage.parameters == []
+        assert fragment_watch_stage.parameters == []
 
     def test_custom_parameters(self):
         """Test that custom parameters can be added."""
         params = [create_time_param()]
-        stage = create_fragment_file_watch_stage(
-            "/path/to/shader.fs", parameters=params, shader_code=""
-        )
+        stage = create_fragment_file_watch_stage(FRAGMENT_PATH, parameters=params, shader_code="")
         assert len(stage.parameters) == 1
         assert stage.parameters[0].param_type == ParamType.CLOCK
 
 
+@pytest.fixture
+def default_vertex_stage():
+    """Provide a vertex stage from create_default_vertex_stage."""
+    return create_default_vertex_stage()
+
+
 class TestCreateDefaultVertexStage:
     """Test create_default_vertex_stage function."""
 
@@ -532,46 +502,40 @@ class TestCreateDefaultVertexStage:
         stage = create_default_vertex_stage()
         assert isinstance(stage, ShaderStage)
 
-    def test_stage_type_is_vertex(self):
+    def test_stage_type_is_vertex(self, default_vertex_stage):
         """Test that stage type is VERTEX."""
-        stage = create_default_vertex_stage()
-        assert stage.stage_type == ShaderStageType.VERTEX
+        assert default_vertex_stage.stage_type == ShaderStageType.VERTEX
 
-    def test_file_watch_disabled(self):
+    def test_file_watch_disabled(self, default_vertex_stage):
         """Test that file watching is disabled for default shader."""
-        stage = create_default_vertex_stage()
-        assert stage.file_watch is False
+        assert default_vertex_stage.file_watch is False
 
-    def test_has_sources(self):
+    def test_has_sources(self, default_vertex_stage):
         """Test that sources list is not empty."""
-        stage = create_default_vertex_stage()
-        assert len(stage.sources) > 0
+        assert len(default_vertex_stage.sources) > 0
 
     def test_default_profile_gl3(self):
         """Test that default profile is GL3."""
         stage = create_default_vertex_stage()
         assert stage.sources[0].profile == ShaderProfile.GL3
 
-    def test_custom_profile(self):
-        """Test that custom profile can be set."""
-        stage = create_default_vertex_stage(profile=ShaderProfile.MTL)
-        assert stage.sources[0].profile == ShaderProfile.MTL
-
-    def test_has_source_code(self):
+    def test_has_source_code(self, default_vertex_stage):
         """Test that source code is not empty."""
-        stage = create_default_vertex_stage()
-        assert len(stage.sources[0].code) > 0
+        assert len(default_vertex_stage.sources[0].code) > 0
 
-    def test_includes_mvp_parameter(self):
+    def test_includes_mvp_parameter(self, default_vertex_stage):
         """Test that MVP parameter is included."""
-        stage = create_default_vertex_stage()
-        assert len(stage.parameters) == 1
-        assert stage.parameters[0].param_type == ParamType.TRANSFORM_MVP
+        assert len(default_vertex_stage.parameters) == 1
+        assert default_vertex_stage.parameters[0].param_type == ParamType.TRANSFORM_MVP
 
-    def test_gl3_shader_contains_version(self):
+    def test_gl3_shader_contains_version(self, default_vertex_stage):
         """Test that GL3 shader contains version directive."""
-        stage = create_default_vertex_stage(profile=ShaderProfile.GL3)
-        assert "#version" in stage.sources[0].code
+        assert "#version" in default_vertex_stage.sources[0].code
+
+    def test_custom_profile(self):
+        """Test that custom profile can be set."""
+        stage = create_default_vertex_stage(profile=ShaderProfile.MTL)
+        assert stage.sources[0].profile == ShaderProfile.MTL
 
     def test_metal_shader_contains_metal_stdlib(self):
         """Test that Metal shader contains metal_stdlib."""
@@ -584,8 +548,8 @@ class TestFileWatchIntegration:
 
     def test_vertex_and_fragment_watch_together(self):
         """Test creating both vertex and fragment file watch stages."""
-        vertex = create_vertex_file_watch_stage("/path/to/shader.vs", shader_code="")
-        fragment = create_fragment_file_watch_stage("/path/to/shader.fs", shader_code="")
+        vertex = create_vertex_file_watch_stage(VERTEX_PATH, shader_code="")
+        fragment = create_fragment_file_watch_stage(FRAGMENT_PATH, shader_code="")
 
         assert vertex.stage_type == ShaderStageType.VERTEX
         assert fragment.stage_type == ShaderStageType.FRAGMENT
@@ -595,7 +559,7 @@ class TestFileWatchIntegration:
     def test_mixed_embedded_and_watch(self):
         """Test mixing embedded and file watch stages."""
         vertex = create_default_vertex_stage()
-        fragment = create_fragment_file_watch_stage("/path/to/shader.fs", shader_code="")
+        fragment = create_fragment_file_watch_stage(FRAGMENT_PATH, shader_code="")
 
         assert vertex.file_watch is False
         assert fragment.file_watch is True
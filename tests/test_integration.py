@@ -1,6 +1,5 @@
 """Integration tests for the klproj package."""
 
-import os
 import xml.etree.ElementTree as ET
 import zlib
 
@@ -26,7 +25,7 @@ from klproj.cli import extract_klproj, verify_klproj
 class TestEndToEndWorkflow:
     """Test complete end-to-end workflows."""
 
-    def test_create_save_extract_verify(self, temp_dir):
+    def test_create_save_extract_verify(self, tmp_path):
         """Test complete workflow: create -> save -> extract -> verify."""
         # Create a project
         builder = KodeProjBuilder(api="GL3")
@@ -76,19 +75,18 @@ void main() {
         builder.add_pass(render_pass)
 
         # Save the project
-        klproj_path = os.path.join(temp_dir, "test.klproj")
+        klproj_path = tmp_path / "test.klproj"
         builder.save(klproj_path)
-        assert os.path.exists(klproj_path)
+        assert klproj_path.exists()
 
         # Extract it
-        xml_path = os.path.join(temp_dir, "extracted.xml")
+        xml_path = tmp_path / "extracted.xml"
         result = extract_klproj(klproj_path, xml_path)
         assert result == 0
-        assert os.path.exists(xml_path)
+        assert xml_path.exists()
 
         # Verify content
-        with open(xml_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = xml_path.read_text(encoding="utf-8")
         assert "Integration Test" in content
         assert "GL3" in content
         assert "time" in content
@@ -98,7 +96,7 @@ void main() {
         result = verify_klproj(klproj_path)
         assert result == 0
 
-    def test_shadertoy_compatible_project(self, temp_dir, shadertoy_fragment_shader):
+    def test_shadertoy_compatible_project(self, tmp_path, shadertoy_fragment_shader):
         """Test creating a Shadertoy-compatible project."""
         builder = KodeProjBuilder(api="GL3")
         builder.set_resolution(1920, 1080)
@@ -137,15 +135,14 @@ void main() { gl_Position = mvp * a_position; }"""
         builder.add_pass(render_pass)
 
         # Save and verify
-        klproj_path = os.path.join(temp_dir, "shadertoy.klproj")
+        klproj_path = tmp_path / "shadertoy.klproj"
         builder.save(klproj_path)
 
         # Extract and check for Shadertoy uniforms
-        xml_path = os.path.join(temp_dir, "shadertoy.xml")
+        xml_path = tmp_path / "shadertoy.xml"
         extract_klproj(klproj_path, xml_path)
 
-        with open(xml_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = xml_path.read_text(encoding="utf-8")
 
         # Verify all Shadertoy uniforms are present
         assert "iResolution" in content
@@ -156,7 +153,7 @@ void main() { gl_Position = mvp * a_position; }"""
         assert "iDate" in content
         assert "iSampleRate" in content
 
-    def test_multi_profile_project(self, temp_dir):
+    def test_multi_profile_project(self, tmp_path):
         """Test creating a project with multiple shader profiles."""
         builder = KodeProjBuilder(api="GL3")
         builder.set_resolution(1280, 720)
@@ -215,11 +212,11 @@ fragment float4 fragment_main() {
         builder.add_pass(render_pass)
 
         # Save and verify
-        klproj_path = os.path.join(temp_dir, "multiprofile.klproj")
+        klproj_path = tmp_path / "multiprofile.klproj"
         builder.save(klproj_path)
 
         # Extract and verify both profiles are present
-        xml_path = os.path.join(temp_dir, "multiprofile.xml")
+        xml_path = tmp_path / "multiprofile.xml"
         extract_klproj(klproj_path, xml_path)
 
         root = ET.parse(xml_path).getroot()
@@ -237,7 +234,7 @@ fragment float4 fragment_main() {
 class TestMultiPassProjects:
     """Test projects with multiple render passes."""
 
-    def test_two_pass_project(self, temp_dir):
+    def test_two_pass_project(self, tmp_path):
         """Test creating a two-pass project."""
         builder = KodeProjBuilder(api="GL3")
         builder.set_resolution(1920, 1080)
@@ -301,11 +298,11 @@ void main() { fragColor = vec4(0.0, 1.0, 0.0, 1.0); }"""
         builder.add_pass(pass1).add_pass(pass2)
 
         # Save and verify
-        klproj_path = os.path.join(temp_dir, "twopass.klproj")
+        klproj_path = tmp_path / "twopass.klproj"
         builder.save(klproj_path)
 
         # Extract and verify structure
-        xml_path = os.path.join(temp_dir, "twopass.xml")
+        xml_path = tmp_path / "twopass.xml"
         extract_klproj(klproj_path, xml_path)
 
         root = ET.parse(xml_path).getroot()
@@ -319,7 +316,7 @@ void main() { fragColor = vec4(0.0, 1.0, 0.0, 1.0); }"""
 class TestComplexParameters:
     """Test projects with complex parameter configurations."""
 
-    def test_custom_float_parameters(self, temp_dir):
+    def test_custom_float_parameters(self, tmp_path):
         """Test project with custom float parameters."""
         from klproj.types import Vec4
 
@@ -374,10 +371,10 @@ class TestComplexParameters:
         builder.add_pass(render_pass)
 
         # Save and verify
-        klproj_path = os.path.join(temp_dir, "custom_params.klproj")
+        klproj_path = tmp_path / "custom_params.klproj"
         builder.save(klproj_path)
 
-        xml_path = os.path.join(temp_dir, "custom_params.xml")
+        xml_path = tmp_path / "custom_params.xml"
         extract_klproj(klproj_path, xml_path)
 
         root = ET.parse(xml_path).getroot()
@@ -392,7 +389,7 @@ class TestComplexParameters:
         assert speed_param_elem is not None
         assert speed_param_elem.find("variableName").text == "speed"
 
-    def test_mouse_interaction_project(self, temp_dir):
+    def test_mouse_interaction_project(self, tmp_path):
         """Test project with mouse interaction."""
         builder = KodeProjBuilder(api="GL3")
         builder.set_resolution(1920, 1080)
@@ -439,14 +436,13 @@ void main() {
         builder.add_pass(render_pass)
 
         # Save and verify
-        klproj_path = os.path.join(temp_dir, "mouse.klproj")
+        klproj_path = tmp_path / "mouse.klproj"
         builder.save(klproj_path)
 
-        xml_path = os.path.join(temp_dir, "mouse.xml")
+        xml_path = tmp_path / "mouse.xml"
         extract_klproj(klproj_path, xml_path)
 
-        with open(xml_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = xml_path.read_text(encoding="utf-8")
 
         assert "mouse" in content
         assert "INPUT_MOUSE_SIMPLE" in content
@@ -456,7 +452,7 @@ void main() {
 class TestRealWorldScenarios:
     """Test real-world usage scenarios."""
 
-    def test_minimal_gradient_shader(self, temp_dir):
+    def test_minimal_gradient_shader(self, tmp_path):
         """Test creating a minimal gradient shader project."""
         builder = KodeProjBuilder(api="GL3")
         builder.set_resolution(1920, 1080)
@@ -499,21 +495,19 @@ void main() {
 
         builder.add_pass(render_pass)
 
-        klproj_path = os.path.join(temp_dir, "gradient.klproj")
+        klproj_path = tmp_path / "gradient.klproj"
         builder.save(klproj_path)
 
         # Verify file is valid
-        assert os.path.exists(klproj_path)
-        assert os.path.getsize(klproj_path) > 0
+        assert klproj_path.exists()
+        assert klproj_path.stat().st_size > 0
 
         # Verify can be decompressed
-        with open(klproj_path, "rb") as f:
-            compressed = f.read()
-        decompressed = zlib.decompress(compressed)
+        decompressed = zlib.decompress(klproj_path.read_bytes())
         root = ET.fromstring(decompressed)
         assert root.tag == "klxml"
 
-    def test_animated_rainbow_shader(self, temp_dir):
+    def test_animated_rainbow_shader(self, tmp_path):
         """Test creating an animated rainbow shader."""
         builder = KodeProjBuilder(api="GL3")
         builder.set_resolution(1920, 1080)
@@ -559,22 +553,21 @@ void main() {
 
         builder.add_pass(render_pass)
 
-        klproj_path = os.path.join(temp_dir, "rainbow.klproj")
+        klproj_path = tmp_path / "rainbow.klproj"
         builder.save(klproj_path)
 
         # Verify
-        xml_path = os.path.join(temp_dir, "rainbow.xml")
+        xml_path = tmp_path / "rainbow.xml"
         extract_klproj(klproj_path, xml_path)
 
-        with open(xml_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = xml_path.read_text(encoding="utf-8")
 
         assert "Rainbow Example" in content
         assert "time" in content
         assert "resolution" in content
         assert "cos(time" in content or "cos" in content
 
-    def test_method_chaining_workflow(self, temp_dir):
+    def test_method_chaining_workflow(self, tmp_path):
         """Test using method chaining for fluent API."""
         # Create entire project using method chaining
         builder = (
@@ -612,16 +605,15 @@ void main() {
 
         builder.add_pass(render_pass)
 
-        klproj_path = os.path.join(temp_dir, "chaining.klproj")
+        klproj_path = tmp_path / "chaining.klproj"
         builder.save(klproj_path)
 
         # Verify
-        assert os.path.exists(klproj_path)
-        xml_path = os.path.join(temp_dir, "chaining.xml")
+        assert klproj_path.exists()
+        xml_path = tmp_path / "chaining.xml"
         extract_klproj(klproj_path, xml_path)
 
-        with open(xml_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = xml_path.read_text(encoding="utf-8")
 
         assert "Chaining Test" in content
         assert "Testing method chaining" in content
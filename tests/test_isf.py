@@ -11,7 +11,13 @@ from klproj.isf_converter import (
     convert_isf_input_to_parameter,
     convert_isf_to_kodelife,
 )
-from klproj.isf_parser import ISFShader, parse_isf_file, parse_isf_string
+from klproj.isf_parser import (
+    ISFInput,
+    ISFShader,
+    find_isf_header_bounds,
+    parse_isf_file,
+    parse_isf_string,
+)
 
 # Sample ISF shaders for testing
 SIMPLE_ISF = """/*
@@ -199,6 +205,24 @@ class TestISFParser:
         assert "endImage" in input_names
         assert "progress" in input_names
 
+    def test_classification_tracks_input_changes(self):
+        """Test that filter/generator checks see inputs added after parsing."""
+        shader = parse_isf_string(GENERATOR_ISF)
+        assert shader.is_generator
+
+        shader.inputs.append(ISFInput(name="inputImage", input_type="image"))
+        assert shader.is_filter
+        assert not shader.is_generator
+
+    def test_classification_tracks_replaced_inputs(self):
+        """Test that classification sees an input replaced in place."""
+        shader = ISFShader(inputs=[ISFInput(name="x", input_type="float")])
+        assert not shader.is_filter
+
+        shader.inputs[0] = ISFInput(name="inputImage", input_type="image")
+        assert shader.is_filter
+        assert not shader.is_generator
+
     def test_parse_with_passes(self):
         """Test parsing ISF with render passes."""
         shader = parse_isf_string(PERSISTENT_BUFFER_ISF)
@@ -257,6 +281,34 @@ void main() {
         with pytest.raises(ValueError, match="No JSON metadata found"):
             parse_isf_string(invalid_isf)
 
+    def test_header_with_comment_terminator_in_json(self):
+        """Test that a "*/" inside the JSON does not end the metadata block early."""
+        isf = '/* {"DESCRIPTION": "a */ b"} */\nvoid main() {}'
+        shader = parse_isf_string(isf)
+        assert shader.description == "a */ b"
+        assert shader.shader_code == "void main() {}"
+
+    def test_header_with_braces_in_json_strings(self):
+        """Test that braces and comment markers inside JSON strings are skipped."""
+        isf = '/*\n{"DESCRIPTION": "ends with }*/", "CREDIT": "/* \\" {"}\n*/\nvoid main() {}'
+        shader = parse_isf_string(isf)
+        assert shader.description == "ends with }*/"
+        assert shader.credit == '/* " {'
+        assert shader.shader_code == "void main() {}"
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            pytest.param('/* {"A": "}"} */\nvoid main() {}', (3, 13, 16), id="header"),
+            pytest.param("void main() {}", None, id="no_comment"),
+            pytest.param("/* plain comment */", None, id="no_json"),
+            pytest.param('/* {"A": 1}', None, id="unterminated"),
+        ],
+    )
+    def test_find_isf_header_bounds(self, content, expected):
+        """Test locating the JSON block of the leading ISF comment."""
+        assert find_isf_header_bounds(content) == expected
+
 
 class TestISFConverter:
     """Test ISF to KodeLife conversion."""
@@ -0,0 +1,262 @@
+"""Tests for klproj.utils.isf_discovery module."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from klproj.utils.isf_discovery import ISFDiscovery, ISFInfo, default_cache_path
+
+# Minimal ISF sources for the scan tests
+BLUR_ISF = '/*{"DESCRIPTION": "Blur", "CATEGORIES": ["Blur"], "INPUTS": []}*/\nvoid main() {}\n'
+FEEDBACK_ISF = (
+    '/*{"DESCRIPTION": "Feedback", "PASSES": [{"TARGET": "buf", "PERSISTENT": true}, {}]}*/\n'
+    "void main() {}\n"
+)
+NOT_ISF = "void main() {}\n"
+
+
+class TestDefaultCachePath:
+    """Test locating the default scan cache."""
+
+    def test_xdg_cache_home(self, tmp_path, monkeypatch):
+        """Test that XDG_CACHE_HOME is honoured."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_path() == tmp_path / "klproj" / "isf_index.json"
+
+    @pytest.mark.parametrize("xdg_cache_home", [None, "", "relative/cache"])
+    def test_home_cache(self, tmp_path, monkeypatch, xdg_cache_home):
+        """Test falling back to ~/.cache when XDG_CACHE_HOME is unset or unusable."""
+        if xdg_cache_home is None:
+            monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        else:
+            monkeypatch.setenv("XDG_CACHE_HOME", xdg_cache_home)
+        monkeypatch.setattr(Path, "home", classmethod(lambda cls: tmp_path))
+
+        assert default_cache_path() == tmp_path / ".cache" / "klproj" / "isf_index.json"
+
+    def test_unresolvable_home(self, monkeypatch):
+        """Test that no default is given when the home directory is unknown."""
+
+        def _no_home(cls):
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setattr(Path, "home", classmethod(_no_home))
+
+        assert default_cache_path() is None
+
+
+class TestISFDiscoveryFilter:
+    """Test filtering shaders by category."""
+
+    def test_filter_by_category_ignores_case(self):
+        """Test that categories match case-insensitively and non-strings are skipped."""
+        blur = ISFInfo(Path("blur.fs"), False, categories=[3, "Stylize", "BLUR"])
+        glitch = ISFInfo(Path("glitch.fs"), False, categories=["Glitch"])
+        discovery = ISFDiscovery([])
+
+        assert discovery.filter_by_category("Blur", [blur, glitch]) == [blur]
+        assert discovery.filter_by_category("3", [blur, glitch]) == []
+
+    def test_filter_by_category_tracks_replaced_category(self):
+        """Test that replacing a category in place is seen by the filter."""
+        info = ISFInfo(Path("blur.fs"), False, categories=["Blur"])
+        discovery = ISFDiscovery([])
+        assert discovery.filter_by_category("blur", [info]) == [info]
+
+        info.categories[0] = "Glitch"
+        assert discovery.filter_by_category("blur", [info]) == []
+        assert discovery.filter_by_category("glitch", [info]) == [info]
+
+
+class TestISFDiscoveryScan:
+    """Test scanning directories for ISF files."""
+
+    def test_scan_tolerates_null_categories(self, tmp_path):
+        """Test that a shader with "CATEGORIES": null does not break the scan."""
+        (tmp_path / "blur.fs").write_text(
+            '/*{"CATEGORIES": ["Blur"], "INPUTS": []}*/\nvoid main() {}\n'
+        )
+        (tmp_path / "odd.fs").write_text('/*{"CATEGORIES": null, "INPUTS": []}*/\nvoid main() {}\n')
+
+        discovery = ISFDiscovery([str(tmp_path)], max_workers=1)
+        multipass, single_pass = discovery.scan()
+
+        assert multipass == []
+        assert sorted(s.name for s in single_pass) == ["blur", "odd"]
+        odd = next(s for s in single_pass if s.name == "odd")
+        assert odd.categories == []
+        assert [s.name for s in discovery.filter_by_category("blur", single_pass)] == ["blur"]
+
+    def test_filter_by_category_sees_changes_after_scan(self, tmp_path):
+        """Test that filtering reflects shaders and categories changed after scan()."""
+        (tmp_path / "blur.fs").write_text(BLUR_ISF)
+        (tmp_path / "glow.fs").write_text(BLUR_ISF)
+        discovery = ISFDiscovery([str(tmp_path)], max_workers=1)
+        _, single_pass = discovery.scan()
+        single_pass.sort(key=lambda s: s.name)
+
+        removed = single_pass.pop()
+        assert [s.name for s in discovery.filter_by_category("BLUR", single_pass)] == ["blur"]
+
+        single_pass[0].categories[0] = "Glitch"
+        assert discovery.filter_by_category("blur", single_pass) == []
+        assert discovery.filter_by_category("glitch", single_pass) == [single_pass[0]]
+        assert discovery.filter_by_category("blur", [removed]) == [removed]
+
+    def test_save_to_json_handles_large_integers(self, tmp_path):
+        """Test that metadata integers too wide for orjson are still written."""
+        (tmp_path / "big.fs").write_text(
+            '/*{"PASSES": [{"TARGET": "buf", "WIDTH": 100000000000000000000}, {}]}*/\n'
+            "void main() {}\n"
+        )
+        output_path = tmp_path / "out" / "shaders.json"
+        output_path.parent.mkdir()
+
+        discovery = ISFDiscovery([str(tmp_path)], max_workers=1)
+        discovery.scan()
+        discovery.save_to_json(str(output_path))
+
+        data = json.loads(output_path.read_text())
+        assert data["multipass"][0]["passes"][0]["WIDTH"] == 10**20
+        assert data["summary"]["total"] == 1
+
+
+@pytest.fixture
+def read_counter(monkeypatch):
+    """Count the files ISFDiscovery actually reads, by path name."""
+    reads = []
+    classify = ISFDiscovery._classify_file
+
+    def _counting(self, file_path):
+        reads.append(file_path.name)
+        return classify(self, file_path)
+
+    monkeypatch.setattr(ISFDiscovery, "_classify_file", _counting)
+    return reads
+
+
+def _scan(base_dir, cache_path):
+    """Scan base_dir serially with the given cache file."""
+    discovery = ISFDiscovery([str(base_dir)], max_workers=1, cache_path=str(cache_path))
+    return discovery.scan()
+
+
+def _cached_files(cache_path):
+    """Return the file entries stored in a cache file."""
+    return json.loads(cache_path.read_text())["files"]
+
+
+class TestISFDiscoveryCache:
+    """Test the per-file scan cache."""
+
+    @pytest.fixture
+    def shader_dir(self, tmp_path):
+        """Provide a directory with a single-pass, a multipass and a non-ISF file."""
+        shader_dir = tmp_path / "shaders"
+        shader_dir.mkdir()
+        (shader_dir / "blur.fs").write_text(BLUR_ISF)
+        (shader_dir / "feedback.fs").write_text(FEEDBACK_ISF)
+        (shader_dir / "plain.fs").write_text(NOT_ISF)
+        return shader_dir
+
+    def test_unchanged_files_are_not_read_again(self, tmp_path, shader_dir, read_counter):
+        """Test that a second scan is answered from the cache."""
+        cache_path = tmp_path / "cache.json"
+        first = _scan(shader_dir, cache_path)
+        assert sorted(read_counter) == ["blur.fs", "feedback.fs", "plain.fs"]
+
+        read_counter.clear()
+        second = _scan(shader_dir, cache_path)
+        assert read_counter == []
+        assert second == first
+        assert second[0][0].num_passes == 2
+
+    def test_non_isf_files_are_cached(self, tmp_path, shader_dir, read_counter):
+        """Test that files without ISF metadata are remembered as such."""
+        cache_path = tmp_path / "cache.json"
+        _scan(shader_dir, cache_path)
+        assert _cached_files(cache_path)[os.path.abspath(shader_dir / "plain.fs")][2] is None
+
+        read_counter.clear()
+        _, single_pass = _scan(shader_dir, cache_path)
+        assert "plain.fs" not in read_counter
+        assert [s.name for s in single_pass] == ["blur"]
+
+    def test_changed_file_is_read_again(self, tmp_path, shader_dir, read_counter):
+        """Test that a file whose size or mtime changed is re-read."""
+        cache_path = tmp_path / "cache.json"
+        _scan(shader_dir, cache_path)
+
+        blur = shader_dir / "blur.fs"
+        blur.write_text(BLUR_ISF.replace('"Blur", "CATEGORIES"', '"Sharper blur", "CATEGORIES"'))
+        read_counter.clear()
+        _, single_pass = _scan(shader_dir, cache_path)
+
+        assert read_counter == ["blur.fs"]
+        assert single_pass[0].description == "Sharper blur"
+
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            pytest.param(b"{not json", id="corrupt"),
+            pytest.param(b'{"version": 0, "files": {}}', id="other_version"),
+            pytest.param(b"[]", id="not_a_dict"),
+        ],
+    )
+    def test_unusable_cache_is_ignored(self, tmp_path, shader_dir, read_counter, contents):
+        """Test that an unreadable or foreign cache file is replaced."""
+        cache_path = tmp_path / "cache.json"
+        cache_path.write_bytes(contents)
+
+        multipass, single_pass = _scan(shader_dir, cache_path)
+
+        assert len(read_counter) == 3
+        assert [s.name for s in multipass] == ["feedback"]
+        assert [s.name for s in single_pass] == ["blur"]
+        assert len(_cached_files(cache_path)) == 3
+
+    def test_malformed_entry_is_read_again(self, tmp_path, shader_dir, read_counter):
+        """Test that a damaged entry in an otherwise valid cache is re-read."""
+        cache_path = tmp_path / "cache.json"
+        _scan(shader_dir, cache_path)
+        data = json.loads(cache_path.read_text())
+        data["files"][os.path.abspath(shader_dir / "blur.fs")][2] = ["too", "few"]
+        cache_path.write_text(json.dumps(data))
+
+        read_counter.clear()
+        _, single_pass = _scan(shader_dir, cache_path)
+
+        assert read_counter == ["blur.fs"]
+        assert single_pass[0].categories == ["Blur"]
+
+    def test_scans_of_different_directories_share_the_cache(self, tmp_path, read_counter):
+        """Test that scanning one directory keeps another directory's entries."""
+        dir_a = tmp_path / "a"
+        dir_b = tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        (dir_a / "blur.fs").write_text(BLUR_ISF)
+        (dir_b / "feedback.fs").write_text(FEEDBACK_ISF)
+        cache_path = tmp_path / "cache.json"
+
+        _scan(dir_a, cache_path)
+        _scan(dir_b, cache_path)
+        assert len(_cached_files(cache_path)) == 2
+
+        read_counter.clear()
+        _scan(dir_a, cache_path)
+        assert read_counter == []
+
+    def test_deleted_files_are_dropped(self, tmp_path, shader_dir):
+        """Test that entries for files removed from a scanned directory are pruned."""
+        cache_path = tmp_path / "cache.json"
+        _scan(shader_dir, cache_path)
+
+        (shader_dir / "plain.fs").unlink()
+        _scan(shader_dir, cache_path)
+
+        assert os.path.abspath(shader_dir / "plain.fs") not in _cached_files(cache_path)
+        assert len(_cached_files(cache_path)) == 2
@@ -268,3 +268,15 @@ class TestMetalShaderIntegration:
         # Both should use Metal syntax
         assert "#include <metal_stdlib>" in vertex_source.code
         assert "#include <metal_stdlib>" in fragment_source.code
+
+    def test_equivalent_parameter_sets_share_generated_code(self):
+        """Test that parameter lists with the same types and names produce identical code."""
+        first = generate_metal_fragment_shader_shadertoy(create_shadertoy_params())
+        second = generate_metal_fragment_shader_shadertoy(create_shadertoy_params())
+        assert first is second
+
+        renamed = create_shadertoy_params()
+        renamed[1].variable_name = "uTime"
+        renamed_code = generate_metal_fragment_shader_shadertoy(renamed)
+        assert "float uTime;" in renamed_code
+        assert "float iTime;" not in renamed_code
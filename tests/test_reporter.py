@@ -0,0 +1,72 @@
+"""Tests for klproj.utils.reporter module."""
+
+from pathlib import Path
+
+from klproj.utils.batch_processor import ConversionResult
+from klproj.utils.reporter import _PROGRESS_LINES_PER_WRITE, ConversionReporter
+
+
+class TestConversionReporter:
+    """Test progress and summary output."""
+
+    def test_progress_is_written_in_batches(self, capsys):
+        """Test that progress lines are held until a full batch is ready."""
+        reporter = ConversionReporter()
+        total = _PROGRESS_LINES_PER_WRITE
+
+        for i in range(1, total):
+            reporter.report_progress(i, total, f"shader{i}")
+        assert capsys.readouterr().out == ""
+
+        reporter.report_progress(total, total, f"shader{total}")
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[1] == f"[1/{total}]  shader1"
+        assert lines[-1] == f"[{total}/{total}]  shader{total}"
+
+    def test_progress_is_written_before_other_output(self, capsys):
+        """Test that buffered progress comes out before errors, info and the summary."""
+        reporter = ConversionReporter()
+        result = ConversionResult(successful=[Path("a.klproj")], failed=[(Path("b.fs"), "boom")])
+
+        reporter.report_progress(1, 3, "a")
+        reporter.report_file_success(Path("a.klproj"), file_size=1024)
+        reporter.report_progress(2, 3, "b")
+        assert capsys.readouterr().out == ""
+
+        # Errors go to stderr, after the progress lines reach stdout
+        reporter.report_file_error("boom")
+        captured = capsys.readouterr()
+        assert captured.out == "\n[1/3]  a\n   ✓ Created a.klproj (1,024 bytes)\n\n[2/3]  b\n"
+        assert captured.err == "   ✗ Error: boom\n"
+
+        reporter.report_file_skip("already converted")
+        reporter.print_info("done")
+        assert capsys.readouterr().out == "   ⊘ Skipped: already converted\ndone\n"
+
+        reporter.report_progress(3, 3, "c")
+        reporter.print_summary(result)
+        lines = [line for line in capsys.readouterr().out.splitlines() if line]
+        assert lines[:2] == ["[3/3]  c", "CONVERSION SUMMARY"]
+        assert "  • b.fs: boom" in lines
+
+    def test_flush(self, capsys):
+        """Test that flush() writes pending progress lines once."""
+        reporter = ConversionReporter()
+        reporter.report_progress(1, 1, "a")
+
+        reporter.flush()
+        assert capsys.readouterr().out == "\n[1/1]  a\n"
+
+        reporter.flush()
+        assert capsys.readouterr().out == ""
+
+    def test_quiet_still_reports_errors(self, capsys):
+        """Test that quiet mode drops progress but keeps errors."""
+        reporter = ConversionReporter(quiet=True)
+        reporter.report_progress(1, 1, "a")
+        reporter.report_file_error("boom")
+        reporter.flush()
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err == "   ✗ Error: boom\n"
@@ -179,6 +179,13 @@ class TestParameter:
         assert isinstance(param.properties["value"], Vec4)
         assert param.properties["value"].x == 1
 
+    def test_parameter_names_are_interned(self):
+        """Test that equal variable names share one string object."""
+        name = "".join(["i", "Time"])
+        first = Parameter(ParamType.CLOCK, "Time", name)
+        second = Parameter(ParamType.CLOCK, "Time", "iTime")
+        assert first.variable_name is second.variable_name
+
 
 class TestShaderSource:
     """Test ShaderSource data class."""
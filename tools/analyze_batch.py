@@ -200,6 +200,15 @@ def parse_args():
         help="ISF source directory for enhanced analysis (used with --check-undefined)",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes (default: 1 = serial)",
+    )
+
     parser.add_argument(
         "--save-results",
         metavar="FILE",
@@ -276,7 +285,10 @@ def main():
 
     # Analyze batch
     result = analyzer.analyze_batch(
-        files=klproj_files, checks=checks, reporter=reporter.report_progress
+        files=klproj_files,
+        checks=checks,
+        reporter=reporter.report_progress,
+        max_workers=args.jobs,
     )
 
     # Report individual results
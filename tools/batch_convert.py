@@ -46,7 +46,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from klproj.utils.batch_processor import BatchConverter
-from klproj.utils.isf_discovery import ISFDiscovery
+from klproj.utils.isf_discovery import ISFDiscovery, default_cache_path
 from klproj.utils.reporter import ConversionReporter
 
 
@@ -68,6 +68,18 @@ def parse_args():
         "Default: /Users/andre/Library/Graphics/ISF",
     )
 
+    parser.add_argument(
+        "--cache-file",
+        metavar="FILE",
+        help="Scan cache; unchanged files are not re-read "
+        "(default: $XDG_CACHE_HOME/klproj/isf_index.json, "
+        "or ~/.cache/klproj/isf_index.json)",
+    )
+
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Do not read or write the scan cache"
+    )
+
     parser.add_argument(
         "-o",
         "--output-dir",
@@ -136,6 +148,15 @@ def parse_args():
         "--overwrite", action="store_true", help="Overwrite existing .klproj files"
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes (default: 1 = serial)",
+    )
+
     # Output options
     parser.add_argument(
         "--save-results",
@@ -182,7 +203,8 @@ def main():
 
     # Setup ISF discovery
     isf_dirs = args.isf_dirs if args.isf_dirs else None
-    discovery = ISFDiscovery(base_dirs=isf_dirs)
+    cache_path = None if args.no_cache else args.cache_file or default_cache_path()
+    discovery = ISFDiscovery(base_dirs=isf_dirs, cache_path=cache_path)
 
     # Scan for ISF files
     reporter.print_info("\nScanning for ISF files...")
@@ -246,6 +268,7 @@ def main():
         width=args.width,
         height=args.height,
         overwrite=args.overwrite,
+        max_workers=args.jobs,
     )
 
     # Convert batch
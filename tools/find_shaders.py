@@ -38,7 +38,7 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from klproj.utils.isf_discovery import ISFDiscovery
+from klproj.utils.isf_discovery import ISFDiscovery, default_cache_path
 
 
 class DiscoveryReporter:
@@ -151,6 +151,18 @@ def parse_args():
         help="Only show multipass shaders with at least N passes",
     )
 
+    parser.add_argument(
+        "--cache-file",
+        metavar="FILE",
+        help="Scan cache; unchanged files are not re-read "
+        "(default: $XDG_CACHE_HOME/klproj/isf_index.json, "
+        "or ~/.cache/klproj/isf_index.json)",
+    )
+
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Do not read or write the scan cache"
+    )
+
     # Output options
     parser.add_argument(
         "-o",
@@ -195,7 +207,8 @@ def main():
 
     # Setup discovery
     isf_dirs = args.isf_dirs if args.isf_dirs else None
-    discovery = ISFDiscovery(base_dirs=isf_dirs)
+    cache_path = None if args.no_cache else args.cache_file or default_cache_path()
+    discovery = ISFDiscovery(base_dirs=isf_dirs, cache_path=cache_path)
 
     # Scan for shaders
     reporter.print_info("\n🔍 Scanning for ISF shaders...")